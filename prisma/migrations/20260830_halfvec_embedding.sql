@@ -0,0 +1,19 @@
+-- Migration: store chunk embeddings as halfvec to halve vector bandwidth
+-- Run this on Vaultbrix (tenant_snipara schema)
+-- Requires pgvector >= 0.7. HNSW traversal is memory-bandwidth bound;
+-- half-precision storage cuts bytes per distance computation in half
+-- with <1% recall loss at 1024 dims.
+
+SET maintenance_work_mem = '2GB';
+SET max_parallel_maintenance_workers = 7;
+
+-- The HNSW index must be rebuilt for the new operator class
+DROP INDEX IF EXISTS document_chunks_embedding_hnsw_idx;
+
+ALTER TABLE document_chunks
+    ALTER COLUMN embedding TYPE halfvec(1024)
+    USING embedding::halfvec(1024);
+
+CREATE INDEX document_chunks_embedding_hnsw_idx
+    ON document_chunks USING hnsw (embedding halfvec_cosine_ops)
+    WITH (m = 24, ef_construction = 128);
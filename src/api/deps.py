@@ -37,6 +37,7 @@ from ..usage import (
     is_scan_blocked,
     log_security_event,
     record_access_denial,
+    scan_identifier,
     track_usage,
 )
 
@@ -123,10 +124,10 @@ async def validate_and_rate_limit(
     Raises:
         HTTPException on validation failure
     """
-    # 0. Anti-scan: check if this key prefix is blocked
-    key_prefix = api_key[:12]
-    if await is_scan_blocked(key_prefix):
-        log_security_event("scan.blocked", "api_key", key_prefix, key_prefix)
+    # 0. Anti-scan: check if this key is blocked (hashed prefix identifier)
+    scan_id = scan_identifier(api_key)
+    if await is_scan_blocked(scan_id):
+        log_security_event("scan.blocked", "api_key", scan_id, scan_id)
         raise HTTPException(status_code=429, detail="Too many failed requests. Try again later.")
 
     # 1. Validate auth (OAuth token or API key)
@@ -159,12 +160,12 @@ async def validate_and_rate_limit(
 
     # 2. Check for access denial (team keys with NONE access level)
     if auth_info.get("access_denied"):
-        await record_access_denial(key_prefix, project_id)
+        await record_access_denial(scan_id, project_id)
         log_security_event(
             "access.denied",
             "project",
             project_id,
-            auth_info.get("id", key_prefix),
+            auth_info.get("id", scan_id),
             details={"reason": "team_key_no_access"},
         )
         raise HTTPException(
@@ -236,10 +237,10 @@ async def validate_team_and_rate_limit(
     Returns:
         Tuple of (api_key_info, team, plan)
     """
-    # Anti-scan check
-    key_prefix = api_key[:12]
-    if await is_scan_blocked(key_prefix):
-        log_security_event("scan.blocked", "api_key", key_prefix, key_prefix)
+    # Anti-scan check (hashed key prefix identifier)
+    scan_id = scan_identifier(api_key)
+    if await is_scan_blocked(scan_id):
+        log_security_event("scan.blocked", "api_key", scan_id, scan_id)
         raise HTTPException(status_code=429, detail="Too many failed requests. Try again later.")
 
     team = await get_team_by_slug_or_id(team_slug_or_id)
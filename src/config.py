@@ -92,6 +92,16 @@ class Settings(BaseSettings):
     # Environment name for Sentry
     environment: str = "development"
 
+    # Max concurrent summary writes per worker; overflow queues in Python
+    # instead of exhausting the Postgres connection pool
+    summary_store_concurrency: int = 16
+
+    # Embedding inference backend: "torch" (default) or "onnx".
+    # "onnx" uses sentence-transformers' ONNX Runtime export (requires the
+    # optimum/onnxruntime extras), typically 2-3x faster on CPU-only hosts;
+    # falls back to torch if unavailable.
+    embedding_backend: str = "torch"
+
     # Memory V2 rollout flags
     memory_v2_dual_write: bool = False
     memory_v2_dual_read: bool = False
@@ -24,7 +24,7 @@ from .tips import (
     SEMANTIC_SEARCH_PLANS,
     get_first_query_tips,
 )
-from .tokens import count_tokens, get_encoder
+from .tokens import LARGE_TEXT_THRESHOLD, count_tokens, estimate_tokens, get_encoder
 
 __all__ = [
     # Document structures
@@ -42,7 +42,9 @@ __all__ = [
     "INTERNAL_PATH_PENALTY",
     # Token utilities
     "get_encoder",
+    "LARGE_TEXT_THRESHOLD",
     "count_tokens",
+    "estimate_tokens",
     # Tips
     "get_first_query_tips",
     "SEMANTIC_SEARCH_PLANS",
@@ -5,6 +5,7 @@ documentation sections and indices.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 
 
 @dataclass
@@ -30,6 +31,64 @@ class Section:
     end_line: int
     level: int  # Header level (1-6)
 
+    # Derived fields used by the scoring hot path. These depend only on the
+    # section itself, so they are computed once per section instead of once
+    # per query.
+
+    @cached_property
+    def title_lower(self) -> str:
+        """Lowercased title, computed on first access and cached."""
+        return self.title.lower()
+
+    @cached_property
+    def content_lower(self) -> str:
+        """Lowercased content, computed on first access and cached."""
+        return self.content.lower()
+
+    @cached_property
+    def title_search_bytes(self) -> bytes:
+        """UTF-8 encoding of the lowercased title, for substring counting.
+
+        A single emoji or other non-Latin-1 character forces the whole str
+        into 2- or 4-byte-per-char storage (PEP 393), multiplying the bytes
+        scanned by every ``count``. The UTF-8 haystack stays one byte per
+        ASCII character, and counts are identical because a valid UTF-8
+        needle can never match across codepoint boundaries.
+        """
+        return self.title_lower.encode("utf-8")
+
+    @cached_property
+    def content_search_bytes(self) -> bytes:
+        """UTF-8 encoding of the lowercased content (see title_search_bytes)."""
+        return self.content_lower.encode("utf-8")
+
+    @cached_property
+    def trigrams(self) -> frozenset[str]:
+        """All 3-char substrings of the lowercased title and content.
+
+        Used by the keyword scorer as a pre-filter: a stem can only occur
+        in this section if its first three characters do, so a miss here
+        rejects the keyword in O(1) without scanning the content. Because
+        this is a necessary condition (never sufficient), the filter can
+        not drop a real match.
+        """
+        return frozenset(
+            s[i : i + 3]
+            for s in (self.title_lower, self.content_lower)
+            for i in range(len(s) - 2)
+        )
+
+    @cached_property
+    def length_norm(self) -> float:
+        """BM25-style length normalization factor for content scoring.
+
+        Prevents long sections from dominating via raw keyword counts.
+        avgdl ~2000 chars is a reasonable average section length; floored
+        at 0.15 to avoid near-zero scores for very long sections.
+        """
+        norm = 1.0 / (1.0 + 0.75 * (len(self.content) / 2000.0 - 1.0))
+        return max(norm, 0.15)
+
 
 @dataclass
 class DocumentationIndex:
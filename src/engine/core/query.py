@@ -77,8 +77,8 @@ def is_abstract_query(query: str) -> bool:
     for term in QUERY_EXPANSIONS.keys():
         if term in query_lower:
             return True
-    # Also check for conceptual prefixes
-    return any(query_lower.startswith(p) for p in CONCEPTUAL_PREFIXES)
+    # Also check for conceptual prefixes (startswith takes the whole tuple)
+    return query_lower.startswith(CONCEPTUAL_PREFIXES)
 
 
 def is_list_query(query: str) -> bool:
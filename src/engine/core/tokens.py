@@ -21,13 +21,43 @@ def get_encoder() -> tiktoken.Encoding:
     return _encoding
 
 
+# Texts longer than this are estimated from byte length instead of
+# exact-encoded — BPE cost grows linearly and the metadata use cases for
+# very large texts don't need exactness
+LARGE_TEXT_THRESHOLD = 16_384
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate token count from UTF-8 byte length (~3.8 bytes per token).
+
+    Orders of magnitude cheaper than exact BPE encoding and within a few
+    percent on English prose. Used for metadata and budgeting fields where
+    exactness is not required.
+
+    Args:
+        text: Text to estimate tokens for
+
+    Returns:
+        Estimated number of tokens in the text
+    """
+    if not text:
+        return 0
+    return (len(text.encode("utf-8")) * 10 + 38) // 38
+
+
 def count_tokens(text: str) -> int:
     """Count tokens in text using tiktoken.
 
+    Texts over ``LARGE_TEXT_THRESHOLD`` characters fall back to
+    :func:`estimate_tokens` to keep very large documents off the exact
+    BPE path.
+
     Args:
         text: Text to count tokens for
 
     Returns:
         Number of tokens in the text
     """
+    if len(text) > LARGE_TEXT_THRESHOLD:
+        return estimate_tokens(text)
     return len(get_encoder().encode(text))
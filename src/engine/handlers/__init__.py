@@ -75,6 +75,7 @@ from .summary import (
     handle_delete_summary,
     handle_get_summaries,
     handle_store_summary,
+    handle_store_summary_bulk,
 )
 from .swarm import (
     handle_agent_profile_get,
@@ -148,6 +149,7 @@ __all__ = [
     "handle_clear_context",
     # Summary handlers
     "handle_store_summary",
+    "handle_store_summary_bulk",
     "handle_get_summaries",
     "handle_delete_summary",
     # Document handlers
@@ -2,12 +2,15 @@
 
 Handles:
 - rlm_store_summary: Store an LLM-generated summary for a document
+- rlm_store_summary_bulk: Store many summaries with one batch insert
 - rlm_get_summaries: Retrieve stored summaries
 - rlm_delete_summary: Delete stored summaries
 """
 
+import asyncio
 from typing import Any
 
+from ...config import settings
 from ...db import get_db
 from ...models import (
     DeleteSummaryResult,
@@ -21,7 +24,12 @@ from ...models import (
 from .base import HandlerContext, count_tokens
 
 # Plans that support summary storage
-SUMMARY_STORAGE_PLANS = {Plan.PRO, Plan.TEAM, Plan.ENTERPRISE}
+SUMMARY_STORAGE_PLANS = frozenset({Plan.PRO, Plan.TEAM, Plan.ENTERPRISE})
+
+# Bound concurrent summary writes so bursts (e.g. a swarm storing summaries
+# for every section of a large doc) queue here instead of exhausting the
+# Postgres pool with P2024 timeouts
+_store_semaphore = asyncio.Semaphore(settings.summary_store_concurrency)
 
 
 async def handle_store_summary(
@@ -86,66 +94,69 @@ async def handle_store_summary(
     except ValueError:
         summary_type = SummaryType.CONCISE
 
-    db = await get_db()
-
-    # Find the document
-    document = await db.document.find_first(
-        where={
-            "projectId": ctx.project_id,
-            "path": document_path,
-        }
-    )
-
-    if not document:
-        return ToolResult(
-            data={"error": f"Document not found: {document_path}"},
-            input_tokens=count_tokens(summary),
-            output_tokens=0,
-        )
-
     # Calculate token count for the summary
     token_count = count_tokens(summary)
 
-    # Check if summary already exists (upsert)
-    existing = await db.documentsummary.find_first(
-        where={
-            "documentId": document.id,
-            "summaryType": summary_type.value,
-            "sectionId": section_id,
-        }
-    )
+    # Serialize bursty writes: waiters queue here instead of timing out at
+    # the DB layer
+    async with _store_semaphore:
+        db = await get_db()
 
-    if existing:
-        # Update existing summary
-        await db.documentsummary.update(
-            where={"id": existing.id},
-            data={
-                "summary": summary,
-                "tokenCount": token_count,
-                "lineStart": line_start,
-                "lineEnd": line_end,
-                "generatedBy": generated_by,
-            },
+        # Find the document
+        document = await db.document.find_first(
+            where={
+                "projectId": ctx.project_id,
+                "path": document_path,
+            }
         )
-        created = False
-        summary_id = existing.id
-    else:
-        # Create new summary
-        created_summary = await db.documentsummary.create(
-            data={
+
+        if not document:
+            return ToolResult(
+                data={"error": f"Document not found: {document_path}"},
+                input_tokens=count_tokens(summary),
+                output_tokens=0,
+            )
+
+        # Check if summary already exists (upsert)
+        existing = await db.documentsummary.find_first(
+            where={
                 "documentId": document.id,
-                "projectId": ctx.project_id,
-                "summary": summary,
                 "summaryType": summary_type.value,
                 "sectionId": section_id,
-                "lineStart": line_start,
-                "lineEnd": line_end,
-                "tokenCount": token_count,
-                "generatedBy": generated_by,
             }
         )
-        created = True
-        summary_id = created_summary.id
+
+        if existing:
+            # Update existing summary
+            await db.documentsummary.update(
+                where={"id": existing.id},
+                data={
+                    "summary": summary,
+                    "tokenCount": token_count,
+                    "lineStart": line_start,
+                    "lineEnd": line_end,
+                    "generatedBy": generated_by,
+                },
+            )
+            created = False
+            summary_id = existing.id
+        else:
+            # Create new summary
+            created_summary = await db.documentsummary.create(
+                data={
+                    "documentId": document.id,
+                    "projectId": ctx.project_id,
+                    "summary": summary,
+                    "summaryType": summary_type.value,
+                    "sectionId": section_id,
+                    "lineStart": line_start,
+                    "lineEnd": line_end,
+                    "tokenCount": token_count,
+                    "generatedBy": generated_by,
+                }
+            )
+            created = True
+            summary_id = created_summary.id
 
     result = StoreSummaryResult(
         summary_id=summary_id,
@@ -163,6 +174,146 @@ async def handle_store_summary(
     )
 
 
+async def handle_store_summary_bulk(
+    params: dict[str, Any],
+    ctx: HandlerContext,
+) -> ToolResult:
+    """Store many summaries with a single batch insert.
+
+    Bulk entry point for workflows that summarize every section of a large
+    document: all target documents are resolved with one ``find_many`` and
+    the batch is inserted with one ``create_many`` instead of a separate
+    round-trip per summary. Unlike :func:`handle_store_summary`, existing
+    summaries for the same (document, type, section) are skipped rather than
+    updated (``skip_duplicates``).
+
+    Args:
+        params: Dict containing:
+            - summaries: List of dicts, each with document_path and summary
+              plus optional summary_type, section_id, line_start, line_end,
+              generated_by
+
+    Returns:
+        ToolResult with stored/skipped/failed counts and per-index failures
+    """
+    items = params.get("summaries") or []
+
+    # Plan gating
+    if ctx.plan not in SUMMARY_STORAGE_PLANS:
+        return ToolResult(
+            data={
+                "error": "rlm_store_summary_bulk requires Pro plan or higher",
+                "upgrade_url": "/billing/upgrade",
+            },
+            input_tokens=0,
+            output_tokens=0,
+        )
+
+    if not items:
+        return ToolResult(
+            data={"error": "rlm_store_summary_bulk: summaries is required"},
+            input_tokens=0,
+            output_tokens=0,
+        )
+
+    db = await get_db()
+
+    # Resolve all referenced documents in one query
+    paths = {item.get("document_path") for item in items if item.get("document_path")}
+    documents = await db.document.find_many(
+        where={
+            "projectId": ctx.project_id,
+            "path": {"in": list(paths)},
+        }
+    )
+    doc_ids = {d.path: d.id for d in documents}
+
+    # create_many(skip_duplicates) relies on the (documentId, summaryType,
+    # sectionId) unique index, but sectionId is nullable and Postgres treats
+    # NULLs as distinct — whole-document summaries (no section_id, the common
+    # case) would re-insert on every run. Dedupe app-side against the
+    # existing rows instead; the index still backstops non-NULL races.
+    existing_keys: set[tuple[str, str, str | None]] = set()
+    if doc_ids:
+        existing = await db.documentsummary.find_many(
+            where={
+                "projectId": ctx.project_id,
+                "documentId": {"in": list(doc_ids.values())},
+            }
+        )
+        existing_keys = {(s.documentId, s.summaryType, s.sectionId) for s in existing}
+
+    rows: list[dict[str, Any]] = []
+    failed: list[dict[str, Any]] = []
+    skipped = 0
+    total_tokens = 0
+
+    for i, item in enumerate(items):
+        document_path = item.get("document_path", "")
+        summary = item.get("summary", "")
+        if not document_path or not summary:
+            failed.append(
+                {"index": i, "error": "document_path and summary are required"}
+            )
+            continue
+
+        document_id = doc_ids.get(document_path)
+        if not document_id:
+            failed.append({"index": i, "error": f"Document not found: {document_path}"})
+            continue
+
+        try:
+            summary_type = SummaryType(item.get("summary_type", "concise"))
+        except ValueError:
+            summary_type = SummaryType.CONCISE
+
+        key = (document_id, summary_type.value, item.get("section_id"))
+        if key in existing_keys:
+            skipped += 1
+            continue
+        # Also dedupes repeats of the same key within this batch
+        existing_keys.add(key)
+
+        token_count = count_tokens(summary)
+        total_tokens += token_count
+        rows.append(
+            {
+                "documentId": document_id,
+                "projectId": ctx.project_id,
+                "summary": summary,
+                "summaryType": summary_type.value,
+                "sectionId": item.get("section_id"),
+                "lineStart": item.get("line_start"),
+                "lineEnd": item.get("line_end"),
+                "tokenCount": token_count,
+                "generatedBy": item.get("generated_by"),
+            }
+        )
+
+    stored = 0
+    if rows:
+        async with _store_semaphore:
+            stored = await db.documentsummary.create_many(
+                data=rows, skip_duplicates=True
+            )
+
+    data = {
+        "stored": stored,
+        "skipped": skipped,
+        "failed": len(failed),
+        "total_tokens": total_tokens,
+        "failures": failed if failed else None,
+        "message": f"Stored {stored} summary(ies) in one batch"
+        + (f", skipped {skipped} existing" if skipped else ""),
+    }
+
+    return ToolResult(
+        data=data,
+        input_tokens=total_tokens,
+        output_tokens=count_tokens(str(data)),
+    )
+
+
 async def handle_get_summaries(
     params: dict[str, Any],
     ctx: HandlerContext,
@@ -175,6 +326,9 @@ async def handle_get_summaries(
             - summary_type: Filter by summary type (optional)
             - section_id: Filter by section ID (optional)
             - include_content: Include summary content in response (default True)
+            - count_only: Return only total_count/total_tokens, aggregated
+              in SQL without fetching rows (default False)
+            - order_by: "created_desc" (default) or "none" to skip sorting
 
     Returns:
         ToolResult with GetSummariesResult containing matching summaries
@@ -183,6 +337,8 @@ async def handle_get_summaries(
     summary_type_str = params.get("summary_type")
     section_id = params.get("section_id")
     include_content = params.get("include_content", True)
+    count_only = params.get("count_only", False)
+    order_by = params.get("order_by", "created_desc")
 
     # Plan gating
     if ctx.plan not in SUMMARY_STORAGE_PLANS:
@@ -232,11 +388,45 @@ async def handle_get_summaries(
     if section_id:
         where_clause["sectionId"] = section_id
 
-    # Query summaries with document info
+    # Fast path: caller only wants totals — aggregate in SQL instead of
+    # materializing every row
+    if count_only:
+        total_count = await db.documentsummary.count(where=where_clause)
+        total_tokens = 0
+        if total_count:
+            conditions = ['"projectId" = $1']
+            sql_params: list[Any] = [ctx.project_id]
+            for field in ("documentId", "summaryType", "sectionId"):
+                if field in where_clause:
+                    sql_params.append(where_clause[field])
+                    conditions.append(f'"{field}" = ${len(sql_params)}')
+            rows = await db.query_raw(
+                'SELECT COALESCE(SUM("tokenCount"), 0) AS total_tokens '
+                f"FROM document_summaries WHERE {' AND '.join(conditions)}",
+                *sql_params,
+            )
+            if rows:
+                total_tokens = int(rows[0]["total_tokens"])
+
+        result = GetSummariesResult(
+            summaries=[],
+            total_count=total_count,
+            total_tokens=total_tokens,
+        )
+        return ToolResult(
+            data=result.model_dump(),
+            input_tokens=0,
+            output_tokens=0,
+        )
+
+    # Query summaries with document info. The createdAt sort is skipped when
+    # the caller opted out or a section filter already narrows the result to
+    # a handful of rows — no point forcing a sort in Postgres.
+    want_order = order_by == "created_desc" and not section_id
     summaries = await db.documentsummary.find_many(
         where=where_clause,
         include={"document": True},
-        order={"createdAt": "desc"},
+        order={"createdAt": "desc"} if want_order else None,
     )
 
     # Build response
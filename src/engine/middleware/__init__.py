@@ -1,5 +1,13 @@
 """Middleware for MCP tool execution."""
 
-from .auto_remember import maybe_auto_remember
+from .auto_remember import (
+    begin_auto_remember_batch,
+    flush_auto_remember_batch,
+    maybe_auto_remember,
+)
 
-__all__ = ["maybe_auto_remember"]
+__all__ = [
+    "begin_auto_remember_batch",
+    "flush_auto_remember_batch",
+    "maybe_auto_remember",
+]
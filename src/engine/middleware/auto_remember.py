@@ -5,12 +5,22 @@ extracts and stores learnings/decisions from meaningful tool results.
 """
 
 import logging
+from contextvars import ContextVar
 from typing import Any
 
-from ...services.agent_memory import store_memory
+from ...services.agent_memory import store_memory, store_memory_many
 
 logger = logging.getLogger(__name__)
 
+# Per-request buffer of auto-memories awaiting a single batch insert.
+# None means no batch is open and memories are stored immediately.
+_pending_memories: ContextVar[list[dict[str, Any]] | None] = ContextVar(
+    "pending_auto_memories", default=None
+)
+
+# Cap on buffered memories per request; further ones are dropped
+MAX_PENDING_MEMORIES = 32
+
 # Tools that should trigger auto-remember
 # Format: tool_name -> (memory_type, content_extractor_key)
 AUTO_REMEMBER_TOOLS: dict[str, tuple[str, str]] = {
@@ -128,6 +138,42 @@ def extract_memory_content(
     return (memory_type, content)
 
 
+def begin_auto_remember_batch() -> bool:
+    """Open a per-request buffer for auto-memories.
+
+    While a batch is open, `maybe_auto_remember` buffers memories instead of
+    writing them, so a request that runs several tools does one batch insert
+    instead of N individual ones.
+
+    Returns:
+        True if this call opened the batch (the caller owns the flush),
+        False if a batch is already open higher up the call stack.
+    """
+    if _pending_memories.get() is not None:
+        return False
+    _pending_memories.set([])
+    return True
+
+
+async def flush_auto_remember_batch(project_id: str) -> None:
+    """Flush all buffered auto-memories with a single batch insert.
+
+    Args:
+        project_id: The project ID the buffered memories belong to.
+    """
+    pending = _pending_memories.get()
+    _pending_memories.set(None)
+    if not pending:
+        return
+
+    try:
+        await store_memory_many(project_id, pending)
+        logger.debug("Flushed %d auto-memories in one batch", len(pending))
+    except Exception as e:
+        # Never fail the original request due to auto-remember errors
+        logger.warning(f"Auto-remember batch flush failed: {e}")
+
+
 async def maybe_auto_remember(
     tool: str,
     params: dict[str, Any],
@@ -173,18 +219,34 @@ async def maybe_auto_remember(
         if memory_type not in allowed_types:
             return
 
-        # Store the memory
-        await store_memory(
-            project_id=project_id,
-            content=content,
-            memory_type=memory_type.lower(),  # DB uses lowercase
-            scope="project",
-            category="auto-remember",
-            ttl_days=30,  # Auto-memories expire after 30 days
-            source="auto",
-        )
-
-        logger.debug(f"Auto-remembered {memory_type} from {tool}: {content[:50]}...")
+        pending = _pending_memories.get()
+        if pending is not None:
+            # Batch open: buffer for a single insert at end of request
+            if len(pending) < MAX_PENDING_MEMORIES:
+                pending.append(
+                    {
+                        "content": content,
+                        "type": memory_type.lower(),  # DB uses lowercase
+                        "scope": "project",
+                        "category": "auto-remember",
+                        "ttl_days": 30,  # Auto-memories expire after 30 days
+                        "source": "auto",
+                    }
+                )
+        else:
+            # No batch open (e.g. direct handler call): store immediately
+            await store_memory(
+                project_id=project_id,
+                content=content,
+                memory_type=memory_type.lower(),  # DB uses lowercase
+                scope="project",
+                category="auto-remember",
+                ttl_days=30,  # Auto-memories expire after 30 days
+                source="auto",
+            )
+
+        # %-formatting defers string construction until DEBUG is enabled
+        logger.debug("Auto-remembered %s from %s: %.50s...", memory_type, tool, content)
 
     except Exception as e:
         # Never fail the original tool call due to auto-remember errors
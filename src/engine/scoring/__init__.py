@@ -32,6 +32,7 @@ from .constants import (
 )
 from .keyword_scorer import (
     calculate_keyword_score,
+    calculate_keyword_scores_batch,
     expand_keywords,
     extract_keywords,
     filter_ubiquitous_keywords,
@@ -67,6 +68,7 @@ __all__ = [
     "stem_keyword",
     # Keyword scorer
     "calculate_keyword_score",
+    "calculate_keyword_scores_batch",
     "expand_keywords",
     "extract_keywords",
     "filter_ubiquitous_keywords",
@@ -26,6 +26,27 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns — compiled once at import instead of per call.
+# Keyword tokenizer used by extract_keywords.
+_SPLIT_RE = re.compile(r"[^\w]+")
+# All numbered-section patterns combined into one alternation so a single
+# search replaces the per-pattern loop in _apply_list_pattern_boost.
+_LIST_PATTERN_RE = re.compile(
+    "|".join(f"(?:{p})" for p in NUMBERED_SECTION_PATTERNS),
+    re.MULTILINE | re.IGNORECASE,
+)
+# Planned/unpublished content markers as one case-insensitive alternation.
+_PLANNED_MARKER_RE = re.compile(
+    "|".join(re.escape(m) for m in PLANNED_CONTENT_MARKERS),
+    re.IGNORECASE,
+)
+
+# Expansion values lowercased once at import — QUERY_EXPANSIONS is constant,
+# so expand_keywords doesn't re-lower the same strings on every query.
+_QUERY_EXPANSIONS_LOWER: dict[str, tuple[str, ...]] = {
+    key: tuple(v.lower() for v in values) for key, values in QUERY_EXPANSIONS.items()
+}
+
 
 class SectionProtocol(Protocol):
     """Protocol for Section-like objects."""
@@ -48,7 +69,7 @@ def extract_keywords(query: str) -> list[str]:
         List of lowercase keywords, stop words removed.
     """
     # Split on non-alphanumeric characters
-    words = re.split(r"[^\w]+", query.lower())
+    words = _SPLIT_RE.split(query.lower())
     # Filter stop words and very short words
     return [w for w in words if w and len(w) >= 2 and w not in STOP_WORDS]
 
@@ -63,22 +84,25 @@ def expand_keywords(keywords: list[str]) -> list[str]:
         Expanded keyword list with additional terms.
     """
     expanded = list(keywords)
+    # Set mirror of `expanded` so dedup is an O(1) probe instead of an
+    # O(len(expanded)) list scan per candidate expansion.
+    seen = set(expanded)
 
     for keyword in keywords:
-        if keyword in QUERY_EXPANSIONS:
-            for expansion in QUERY_EXPANSIONS[keyword]:
-                expansion_lower = expansion.lower()
-                if expansion_lower not in expanded:
-                    expanded.append(expansion_lower)
-
-        # Also check 2-word phrases
-        for i in range(len(keywords) - 1):
-            phrase = f"{keywords[i]} {keywords[i + 1]}"
-            if phrase in QUERY_EXPANSIONS:
-                for expansion in QUERY_EXPANSIONS[phrase]:
-                    expansion_lower = expansion.lower()
-                    if expansion_lower not in expanded:
-                        expanded.append(expansion_lower)
+        for expansion in _QUERY_EXPANSIONS_LOWER.get(keyword, ()):
+            if expansion not in seen:
+                seen.add(expansion)
+                expanded.append(expansion)
+
+    # Also check 2-word phrases — one linear pass over adjacent pairs
+    # (this used to be nested inside the keyword loop, re-scanning every
+    # pair once per keyword; dedup hid the redundancy but not the cost).
+    for i in range(len(keywords) - 1):
+        phrase = f"{keywords[i]} {keywords[i + 1]}"
+        for expansion in _QUERY_EXPANSIONS_LOWER.get(phrase, ()):
+            if expansion not in seen:
+                seen.add(expansion)
+                expanded.append(expansion)
 
     return expanded
 
@@ -96,68 +120,131 @@ def is_list_query(query: str) -> bool:
     return any(pattern in query_lower for pattern in LIST_QUERY_PATTERNS)
 
 
-def calculate_keyword_score(
-    section: SectionProtocol,
-    keywords: list[str],
-    is_list_query_flag: bool = False,
-) -> float:
-    """Calculate keyword relevance score for a section.
+_PreparedKeyword = tuple[str, str, bytes, bytes, float, "str | None"]
 
-    Scoring factors:
-    - Title matches weighted 5x (not length-normalized)
-    - Content matches weighted 1x (BM25-style length normalization)
-    - Section level bonus (higher level = more important)
-    - Title keyword coverage boost (multi-keyword title match)
-    - Exact phrase match bonus
-    - List/enumeration pattern bonus (when query asks for lists)
 
-    Args:
-        section: The section to score.
-        keywords: List of keywords to match.
-        is_list_query_flag: Whether the query is asking for a list.
+def _prepare_keywords(
+    keywords: list[str],
+) -> tuple[list[_PreparedKeyword], str | None, bytes | None]:
+    """Precompute per-keyword scoring invariants for a query.
+
+    Everything here depends only on the keyword list, not the section, so
+    batch callers compute it once instead of once per section: the stem,
+    the UTF-8 needles for the bytes fast path, the title weight (generic
+    terms get 1.5x, specific terms 5x) and the trigram probe used by the
+    pre-filter, plus the exact-phrase string.
 
     Returns:
-        Keyword relevance score (higher is better).
+        Tuple of (prepared keyword tuples, query_phrase, query_phrase bytes).
     """
+    prepared: list[_PreparedKeyword] = []
+    for keyword in keywords:
+        if len(keyword) < 2:  # Skip very short words
+            continue
+        stem = stem_keyword(keyword)
+        # Generic terms get 1.5x weight, specific terms get 5x.
+        # This prevents "Snipara tools not available" ranking above
+        # actual tool documentation for "What tools does Snipara expose?"
+        if keyword in GENERIC_TITLE_TERMS or stem in GENERIC_TITLE_TERMS:
+            title_weight = 1.5
+        else:
+            title_weight = 5.0
+        probe = stem[:3] if len(stem) >= 3 else None
+        prepared.append(
+            (keyword, stem, keyword.encode("utf-8"), stem.encode("utf-8"), title_weight, probe)
+        )
+
+    # Exact phrase: first 4 significant words of the query, if any
+    query_words = [w for w in keywords if len(w) >= 3]
+    query_phrase = " ".join(query_words[:4]).lower() if len(query_words) >= 2 else None
+    query_phrase_bytes = query_phrase.encode("utf-8") if query_phrase is not None else None
+
+    return prepared, query_phrase, query_phrase_bytes
+
+
+def _score_section(
+    section: SectionProtocol,
+    prepared: list[_PreparedKeyword],
+    query_phrase: str | None,
+    query_phrase_bytes: bytes | None,
+    is_list_query_flag: bool,
+) -> float:
+    """Score one section against pre-prepared keywords (see _prepare_keywords)."""
     score = 0.0
-    title_lower = section.title.lower()
-    content_lower = section.content.lower()
+
+    # Prefer the per-section cached UTF-8 haystacks (see core Section) so
+    # the substring counts scan one byte per ASCII char even when emoji
+    # push the str into wide storage; fall back to lowercased str scans
+    # for plain SectionProtocol objects.
+    title_hay = getattr(section, "title_search_bytes", None)
+    use_bytes = title_hay is not None
+    if use_bytes:
+        content_hay = section.content_search_bytes  # type: ignore[attr-defined]
+        phrase = query_phrase_bytes
+    else:
+        title_hay = getattr(section, "title_lower", None)
+        if title_hay is None:
+            title_hay = section.title.lower()
+        content_hay = getattr(section, "content_lower", None)
+        if content_hay is None:
+            content_hay = section.content.lower()
+        phrase = query_phrase
 
     # BM25-style length normalization for content scoring.
     # Prevents long sections from dominating via raw keyword counts.
     # avgdl ~2000 chars is a reasonable average section length.
-    content_length = len(content_lower)
-    length_norm = 1.0 / (1.0 + 0.75 * (content_length / 2000.0 - 1.0))
-    length_norm = max(length_norm, 0.15)  # Floor to avoid near-zero
+    length_norm = getattr(section, "length_norm", None)
+    if length_norm is None:
+        length_norm = 1.0 / (1.0 + 0.75 * (len(section.content) / 2000.0 - 1.0))
+        length_norm = max(length_norm, 0.15)  # Floor to avoid near-zero
+
+    # Trigram pre-filter (see core Section.trigrams): if the first three
+    # characters of the stem never appear in the section, neither the stem
+    # nor the keyword can, so the .count() scans below are skipped entirely.
+    # Expected-miss keywords drop from O(len(content)) to an O(1) set probe.
+    trigrams = getattr(section, "trigrams", None)
 
     title_keyword_hits = 0
 
-    for keyword in keywords:
-        if len(keyword) < 2:  # Skip very short words
+    for kw_str, stem_str, kw_bytes, stem_bytes, title_weight, probe in prepared:
+        if trigrams is not None and probe is not None and probe not in trigrams:
             continue
 
-        stem = stem_keyword(keyword)
+        if use_bytes:
+            keyword: str | bytes = kw_bytes
+            stem: str | bytes = stem_bytes
+        else:
+            keyword = kw_str
+            stem = stem_str
+
+        # The stem is always a prefix of the keyword, so a zero stem count
+        # implies a zero keyword count — scan for the stem first and only
+        # pay for the exact-keyword pass when there is something to refine.
+        # This halves the bytes scanned for the common miss case.
 
         # Title matches — reduced weight for generic terms
-        title_count = title_lower.count(keyword)
-        # Fall back to stem match for morphological variants
-        # e.g. "prices" (stem "pric") matches title containing "pricing"
-        if title_count == 0 and stem != keyword:
-            title_count = title_lower.count(stem)
+        if stem != keyword:
+            stem_count = title_hay.count(stem)
+            # Refine to an exact match only when the stem occurs at all;
+            # fall back to the stem count for morphological variants,
+            # e.g. "prices" (stem "pric") matches title containing "pricing"
+            title_count = title_hay.count(keyword) if stem_count else 0
+            if title_count == 0:
+                title_count = stem_count
+        else:
+            title_count = title_hay.count(keyword)
         if title_count > 0:
             title_keyword_hits += 1
-            # Generic terms get 1.5x weight, specific terms get 5x
-            # This prevents "Snipara tools not available" ranking above
-            # actual tool documentation for "What tools does Snipara expose?"
-            if keyword in GENERIC_TITLE_TERMS or stem in GENERIC_TITLE_TERMS:
-                score += title_count * 1.5
-            else:
-                score += title_count * 5.0
+            score += title_count * title_weight
 
         # Content matches (length-normalized)
-        content_count = content_lower.count(keyword)
-        if content_count == 0 and stem != keyword:
-            content_count = content_lower.count(stem)
+        if stem != keyword:
+            stem_count = content_hay.count(stem)
+            content_count = content_hay.count(keyword) if stem_count else 0
+            if content_count == 0:
+                content_count = stem_count
+        else:
+            content_count = content_hay.count(keyword)
         score += content_count * length_norm
 
     # Bonus for higher-level sections (h1, h2 more important)
@@ -173,12 +260,9 @@ def calculate_keyword_score(
 
     # Exact phrase match bonus: if the entire query (or a significant portion)
     # appears verbatim in the title, this is very likely the right section.
-    query_words = [w for w in keywords if len(w) >= 3]
-    if len(query_words) >= 2:
-        query_phrase = " ".join(query_words[:4])  # First 4 significant words
-        if query_phrase.lower() in title_lower:
-            score *= 3.0  # 3x bonus for exact phrase in title
-            logger.debug(f"Exact phrase match in title: '{query_phrase}' → '{section.title}'")
+    if phrase is not None and phrase in title_hay:
+        score *= 3.0  # 3x bonus for exact phrase in title
+        logger.debug(f"Exact phrase match in title: '{query_phrase}' → '{section.title}'")
 
     # List/enumeration boost
     if is_list_query_flag and score > 0:
@@ -187,6 +271,67 @@ def calculate_keyword_score(
     return score
 
 
+def calculate_keyword_score(
+    section: SectionProtocol,
+    keywords: list[str],
+    is_list_query_flag: bool = False,
+) -> float:
+    """Calculate keyword relevance score for a section.
+
+    Scoring factors:
+    - Title matches weighted 5x (not length-normalized)
+    - Content matches weighted 1x (BM25-style length normalization)
+    - Section level bonus (higher level = more important)
+    - Title keyword coverage boost (multi-keyword title match)
+    - Exact phrase match bonus
+    - List/enumeration pattern bonus (when query asks for lists)
+
+    When scoring many sections against the same query, prefer
+    :func:`calculate_keyword_scores_batch`, which prepares the keyword
+    invariants once instead of per section.
+
+    Args:
+        section: The section to score.
+        keywords: List of keywords to match.
+        is_list_query_flag: Whether the query is asking for a list.
+
+    Returns:
+        Keyword relevance score (higher is better).
+    """
+    prepared, query_phrase, query_phrase_bytes = _prepare_keywords(keywords)
+    return _score_section(section, prepared, query_phrase, query_phrase_bytes, is_list_query_flag)
+
+
+def calculate_keyword_scores_batch(
+    sections: list[SectionProtocol],
+    keywords: list[str],
+    is_list_query_flag: bool = False,
+) -> list[float]:
+    """Score many sections against the same query in one pass.
+
+    Identical scoring to :func:`calculate_keyword_score`, but the
+    per-query work — stemming, generic-term classification, trigram
+    probes and the exact-phrase string — is prepared once and reused for
+    every section instead of recomputed N times. The substring counts
+    themselves remain per-section C-level ``str.count`` scans; gathering
+    them dominates the cost, so a hit-matrix/NumPy formulation would add
+    allocation without removing any scanning work.
+
+    Args:
+        sections: The sections to score.
+        keywords: List of keywords to match.
+        is_list_query_flag: Whether the query is asking for a list.
+
+    Returns:
+        List of scores, parallel to ``sections``.
+    """
+    prepared, query_phrase, query_phrase_bytes = _prepare_keywords(keywords)
+    return [
+        _score_section(section, prepared, query_phrase, query_phrase_bytes, is_list_query_flag)
+        for section in sections
+    ]
+
+
 def _apply_list_pattern_boost(section: SectionProtocol, base_score: float) -> float:
     """Apply bonus for sections that contain list/enumeration patterns.
 
@@ -197,17 +342,19 @@ def _apply_list_pattern_boost(section: SectionProtocol, base_score: float) -> fl
     Returns:
         Boosted score if list patterns found.
     """
-    combined = f"{section.title}\n{section.content}".lower()
+    # Search title and content separately — allocating a combined lowercased
+    # copy of the whole section per call costs an O(len(content)) memcpy
+    # just to run a couple of case-insensitive searches.
 
     # Check for numbered patterns
-    for pattern in NUMBERED_SECTION_PATTERNS:
-        if re.search(pattern, combined, re.MULTILINE | re.IGNORECASE):
-            return base_score * 1.5
+    if _LIST_PATTERN_RE.search(section.title) or _LIST_PATTERN_RE.search(section.content):
+        return base_score * 1.5
 
     # Check for planned content markers
-    for marker in PLANNED_CONTENT_MARKERS:
-        if marker.lower() in combined:
-            return base_score * 1.3
+    if _PLANNED_MARKER_RE.search(section.title) or _PLANNED_MARKER_RE.search(
+        section.content
+    ):
+        return base_score * 1.3
 
     return base_score
 
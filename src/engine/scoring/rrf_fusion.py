@@ -6,6 +6,8 @@ rankings, along with adaptive weight classification and score normalization.
 
 import re
 
+import numpy as np
+
 from .constants import (
     CONCEPTUAL_PREFIXES,
     HYBRID_BALANCED,
@@ -49,17 +51,30 @@ def classify_query_weights(
     strong_keyword = False
     if kw_values:
         top_kw = max(kw_values)
-        # Top score is at least 3× the median – very confident match
-        median_kw = sorted(kw_values)[len(kw_values) // 2] if kw_values else 0
-        strong_keyword = top_kw > 15 and (median_kw == 0 or top_kw / median_kw >= 3)
-
-    # Signal 2: specific / structured-data terms in the query
-    # Also check stemmed variants so "prices" matches "price" in the set
-    stemmed_words = {stem_keyword(w) for w in query_words}
-    has_specific = bool((query_words | stemmed_words) & SPECIFIC_QUERY_TERMS)
+        # Only bother with the median when the top score can qualify —
+        # most queries fail the top_kw > 15 gate and skip it entirely.
+        if top_kw > 15:
+            # Top score is at least 3× the median – very confident match.
+            # np.partition gives the same element as sorted(...)[n // 2]
+            # in O(N) instead of a full O(N log N) sort.
+            mid = len(kw_values) // 2
+            arr = np.fromiter(kw_values, dtype=np.float64, count=len(kw_values))
+            median_kw = float(np.partition(arr, mid)[mid])
+            strong_keyword = median_kw == 0 or top_kw / median_kw >= 3
+
+    # Signal 2: specific / structured-data terms in the query.
+    # Also check stemmed variants so "prices" matches "price" in the set.
+    # stem_keyword is memoized, so each check is a cache hit; any()
+    # short-circuits on the first specific term instead of building and
+    # unioning two intermediate sets per query.
+    has_specific = any(
+        w in SPECIFIC_QUERY_TERMS or stem_keyword(w) in SPECIFIC_QUERY_TERMS
+        for w in query_words
+    )
 
-    # Signal 3: conceptual query pattern
-    is_conceptual = any(query_lower.startswith(p) for p in CONCEPTUAL_PREFIXES)
+    # Signal 3: conceptual query pattern. str.startswith accepts the whole
+    # prefix tuple, so this is one C-level check instead of a Python loop.
+    is_conceptual = query_lower.startswith(CONCEPTUAL_PREFIXES)
 
     # Priority: specific keyword matches first, then conceptual patterns
     if strong_keyword and has_specific:
@@ -77,6 +92,7 @@ def rrf_fusion(
     keyword_weight: float = 0.40,
     semantic_weight: float = 0.60,
     k: int = RRF_K,
+    top_k: int | None = None,
 ) -> list[tuple[str, float]]:
     """Reciprocal Rank Fusion of keyword and semantic rankings.
 
@@ -98,40 +114,76 @@ def rrf_fusion(
         keyword_weight: Weight for keyword ranking (default 0.40).
         semantic_weight: Weight for semantic ranking (default 0.60).
         k: RRF constant (default 45). Lower = more weight to top results.
+        top_k: If given, return only the top_k best sections. Selected via
+            np.argpartition (O(N) instead of a full sort); under exact score
+            ties at the cutoff, which tied section survives is arbitrary.
 
     Returns:
         List of (section_id, rrf_score) tuples, sorted descending by score.
     """
-    # Build keyword ranking (descending score)
-    kw_ranked = sorted(
-        ((sid, sc) for sid, sc in keyword_scores.items() if sc > 0),
-        key=lambda x: x[1],
-        reverse=True,
-    )
-    kw_rank: dict[str, int] = {sid: rank for rank, (sid, _) in enumerate(kw_ranked, start=1)}
-    default_kw_rank = len(kw_ranked) + 1
-
-    # Build semantic ranking (descending similarity)
-    sem_ranked = sorted(
-        ((sid, sc) for sid, sc in semantic_scores.items() if sc > 0),
-        key=lambda x: x[1],
-        reverse=True,
+    ordered_ids, ordered_scores = _rrf_fused_arrays(
+        keyword_scores, semantic_scores, keyword_weight, semantic_weight, k, top_k
     )
-    sem_rank: dict[str, int] = {sid: rank for rank, (sid, _) in enumerate(sem_ranked, start=1)}
-    default_sem_rank = len(sem_ranked) + 1
+    return list(zip(ordered_ids, ordered_scores.tolist()))
 
-    # Union of all section IDs present in either ranking
-    all_ids = set(kw_rank) | set(sem_rank)
 
-    rrf_scores: list[tuple[str, float]] = []
-    for sid in all_ids:
-        rk = kw_rank.get(sid, default_kw_rank)
-        rs = sem_rank.get(sid, default_sem_rank)
-        score = keyword_weight / (k + rk) + semantic_weight / (k + rs)
-        rrf_scores.append((sid, score))
-
-    rrf_scores.sort(key=lambda x: x[1], reverse=True)
-    return rrf_scores
+def _rrf_fused_arrays(
+    keyword_scores: dict[str, float],
+    semantic_scores: dict[str, float],
+    keyword_weight: float,
+    semantic_weight: float,
+    k: int,
+    top_k: int | None = None,
+) -> tuple[list[str], np.ndarray]:
+    """RRF core shared by rrf_fusion and hybrid_search.
+
+    Returns the fused ranking as (ordered section IDs, descending score
+    array) so hybrid_search can normalize straight off the array without
+    materializing an intermediate tuple list.
+    """
+    # Keep only positively-scored entries from each ranking
+    kw_pos = {sid: sc for sid, sc in keyword_scores.items() if sc > 0}
+    sem_pos = {sid: sc for sid, sc in semantic_scores.items() if sc > 0}
+
+    # Union of all section IDs present in either ranking, mapped to
+    # contiguous integer indices so the rank/score arithmetic runs as
+    # fused NumPy vector ops instead of a Python dict loop
+    ids = list(kw_pos)
+    ids.extend(sid for sid in sem_pos if sid not in kw_pos)
+    if not ids:
+        return [], np.empty(0, dtype=np.float64)
+
+    n = len(ids)
+    id_to_idx = {sid: i for i, sid in enumerate(ids)}
+
+    def _ranks(pos_scores: dict[str, float]) -> np.ndarray:
+        """Scatter 1-based descending-score ranks into a dense array.
+
+        Sections absent from the ranking keep the pessimistic default
+        rank ``len(pos_scores) + 1``.
+        """
+        ranks = np.full(n, len(pos_scores) + 1, dtype=np.float64)
+        if pos_scores:
+            rows = np.fromiter(
+                (id_to_idx[sid] for sid in pos_scores), dtype=np.intp, count=len(pos_scores)
+            )
+            values = np.fromiter(pos_scores.values(), dtype=np.float64, count=len(pos_scores))
+            order = np.argsort(-values, kind="stable")
+            ranks[rows[order]] = np.arange(1, len(pos_scores) + 1)
+        return ranks
+
+    kw_ranks = _ranks(kw_pos)
+    sem_ranks = _ranks(sem_pos)
+
+    scores = keyword_weight / (k + kw_ranks) + semantic_weight / (k + sem_ranks)
+
+    if top_k is not None and top_k < n:
+        # Partition out the top_k entries in O(N), then sort only those
+        top = np.argpartition(-scores, top_k)[:top_k]
+        out_order = top[np.argsort(-scores[top], kind="stable")]
+    else:
+        out_order = np.argsort(-scores, kind="stable")
+    return [ids[i] for i in out_order], scores[out_order]
 
 
 def normalize_scores_graded(
@@ -163,20 +215,32 @@ def normalize_scores_graded(
     top_score = scores[0][1] if scores[0][1] > 0 else 1.0
     result = [(scores[0][0], 100.0)]
 
-    for i, (sid, raw) in enumerate(scores[1:], start=1):
-        # Combine rank-based decay with score-ratio decay
-        # rank_factor: exponential decay based on position (0.94^rank)
-        # score_factor: how close is this score to the top? (raw/top)
-        rank_factor = decay_factor**i
-        score_factor = raw / top_score if top_score > 0 else 0
-
-        # Weighted combination: 40% rank-based, 60% score-based (favor raw scores)
-        # Higher score_weight keeps more relevant sections that may have lower ranks
-        graded = 100 * (0.4 * rank_factor + 0.6 * score_factor)
-
-        # Floor at 1 (never 0 unless truly irrelevant)
-        result.append((sid, max(round(graded, 1), 1.0)))
-
+    # Small result sets stay on the Python loop — NumPy array setup costs
+    # more than it saves below a few dozen entries.
+    if len(scores) < 32:
+        for i, (sid, raw) in enumerate(scores[1:], start=1):
+            # Combine rank-based decay with score-ratio decay
+            # rank_factor: exponential decay based on position (0.94^rank)
+            # score_factor: how close is this score to the top? (raw/top)
+            rank_factor = decay_factor**i
+            score_factor = raw / top_score if top_score > 0 else 0
+
+            # Weighted combination: 40% rank-based, 60% score-based (favor raw scores)
+            # Higher score_weight keeps more relevant sections that may have lower ranks
+            graded = 100 * (0.4 * rank_factor + 0.6 * score_factor)
+
+            # Floor at 1 (never 0 unless truly irrelevant)
+            result.append((sid, max(round(graded, 1), 1.0)))
+
+        return result
+
+    # Vectorized form of the loop above: one power/divide/round per array
+    # instead of per rank (same 40/60 rank/score blend and floor at 1).
+    raw = np.fromiter((s for _, s in scores), dtype=np.float64, count=len(scores))
+    rank_factor = np.power(decay_factor, np.arange(1, len(scores)))
+    score_factor = raw[1:] / top_score if top_score > 0 else np.zeros(len(scores) - 1)
+    graded = np.maximum(np.round(100.0 * (0.4 * rank_factor + 0.6 * score_factor), 1), 1.0)
+    result.extend(zip((sid for sid, _ in scores[1:]), graded.tolist()))
     return result
 
 
@@ -186,6 +250,7 @@ def hybrid_search(
     query: str,
     normalize: bool = True,
     decay_factor: float = 0.94,
+    top_k: int | None = None,
 ) -> list[tuple[str, float]]:
     """Complete hybrid search pipeline: weight classification → RRF → normalize.
 
@@ -197,6 +262,9 @@ def hybrid_search(
         query: The original search query (used for weight classification).
         normalize: Whether to normalize scores to 0-100 scale.
         decay_factor: Decay factor for score normalization.
+        top_k: If given, return only the top_k best sections. Graded scores
+            are rank/top-relative, so truncating before normalization yields
+            the same values as normalizing everything and slicing.
 
     Returns:
         List of (section_id, score) tuples, sorted descending.
@@ -204,16 +272,29 @@ def hybrid_search(
     # Classify query to get adaptive weights
     kw_weight, sem_weight = classify_query_weights(query, keyword_scores)
 
-    # Apply RRF fusion
-    fused = rrf_fusion(
-        keyword_scores=keyword_scores,
-        semantic_scores=semantic_scores,
-        keyword_weight=kw_weight,
-        semantic_weight=sem_weight,
+    # Apply RRF fusion, keeping the fused scores as an array so the graded
+    # normalization below runs on it directly — one pass, no intermediate
+    # (sid, score) tuple list between the two stages
+    ordered_ids, fused = _rrf_fused_arrays(
+        keyword_scores,
+        semantic_scores,
+        kw_weight,
+        sem_weight,
+        RRF_K,
+        top_k,
     )
 
-    # Optionally normalize to 0-100 scale
-    if normalize:
-        return normalize_scores_graded(fused, decay_factor)
+    if not normalize:
+        return list(zip(ordered_ids, fused.tolist()))
 
-    return fused
+    if not ordered_ids:
+        return []
+
+    # Vectorized equivalent of normalize_scores_graded: top gets 100, the
+    # rest blend 40% rank decay with 60% score ratio, floored at 1
+    top_score = fused[0] if fused[0] > 0 else 1.0
+    rank_factor = np.power(decay_factor, np.arange(1, len(ordered_ids)))
+    graded = np.maximum(
+        np.round(100.0 * (0.4 * rank_factor + 0.6 * fused[1:] / top_score), 1), 1.0
+    )
+    return [(ordered_ids[0], 100.0), *zip(ordered_ids[1:], graded.tolist())]
@@ -6,14 +6,32 @@ Two paths are supported:
 2. On-the-fly embeddings (fallback when chunks not available)
 """
 
+import asyncio
+import hashlib
+import heapq
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Protocol
 
+import numpy as np
+
 if TYPE_CHECKING:
-    from ..services.embeddings import EmbeddingsService
+    from ...services.embeddings import EmbeddingsService
 
 logger = logging.getLogger(__name__)
 
+# Process-local LRU of section-text embeddings for the on-the-fly path.
+# Section text is immutable between indexings, so the same sections are
+# re-embedded on every query without this; after warmup most queries only
+# embed cache misses. Keyed by model name + text hash (384 vs 1024 dims).
+_SECTION_EMBED_CACHE: OrderedDict[str, list[float]] = OrderedDict()
+_SECTION_EMBED_CACHE_SIZE = 4096
+
+
+def _section_embed_key(model_name: str, text: str) -> str:
+    """Stable cache key for a section text under a given embedding model."""
+    return hashlib.sha1(f"{model_name}\x00{text}".encode()).hexdigest()
+
 
 class SectionProtocol(Protocol):
     """Protocol for Section-like objects."""
@@ -47,6 +65,10 @@ class SemanticScorer:
         """
         self.project_id = project_id
         self.embeddings_service = embeddings_service
+        # Query embedding pre-warmed during the chunk search so a subsequent
+        # on-the-fly fallback overlaps the encoder with the DB round-trip.
+        self._query_embed_task: asyncio.Task[list[float]] | None = None
+        self._query_embed_text: str | None = None
 
     async def calculate_scores_from_chunks(
         self,
@@ -77,7 +99,23 @@ class SemanticScorer:
             Dictionary mapping section IDs to their semantic similarity scores (0-1).
         """
         # Import here to avoid circular imports
-        from ..services.indexer import DocumentIndexer
+        from ...services.indexer import DocumentIndexer
+
+        # Pre-warm the fallback query embedding concurrently with the DB
+        # round-trip: callers that fall through to on-the-fly scoring then
+        # pay max(db, encode) instead of db + encode. Cheap when the chunk
+        # path succeeds — repeats hit the service's embed cache, and the
+        # encoder runs on the embedding thread pool, off the event loop.
+        if self.embeddings_service is not None:
+            self._query_embed_text = query
+            self._query_embed_task = asyncio.create_task(
+                self.embeddings_service.embed_text_async(query)
+            )
+            # Observe failures so an unused task never logs "exception
+            # was never retrieved"; the fallback re-embeds on its own.
+            self._query_embed_task.add_done_callback(
+                lambda t: t.exception() if not t.cancelled() else None
+            )
 
         indexer = DocumentIndexer(db)
 
@@ -98,22 +136,39 @@ class SemanticScorer:
                     for chunk in result.get("results", [])
                 }
 
-            # Map chunk results back to section IDs by line overlap
+            # Map chunk results back to section IDs by line overlap.
+            # Vectorized interval intersection: the broadcast [C, S] test
+            # replaces the O(C*S) Python nested loop; sections keep the max
+            # similarity across their overlapping chunks. Line bounds are
+            # packed as contiguous int32 arrays (SoA) — attribute access
+            # happens once per section here, not once per chunk*section pair.
+            chunks = result.get("results", [])
             scores: dict[str, float] = {}
-            for chunk in result.get("results", []):
-                chunk_start = chunk.get("start_line", 0)
-                chunk_end = chunk.get("end_line", 0)
-                chunk_similarity = chunk.get("similarity", 0.0)
-
-                for section in sections:
-                    # Check if chunk overlaps with section (by line range)
-                    if chunk_start <= section.end_line and chunk_end >= section.start_line:
-                        # Use max score if section appears in multiple chunks
-                        current_score = scores.get(section.id, 0.0)
-                        scores[section.id] = max(current_score, chunk_similarity)
+            if chunks:
+                n_chunks = len(chunks)
+                chunk_starts = np.fromiter(
+                    (c.get("start_line", 0) for c in chunks), dtype=np.int32, count=n_chunks
+                )
+                chunk_ends = np.fromiter(
+                    (c.get("end_line", 0) for c in chunks), dtype=np.int32, count=n_chunks
+                )
+                chunk_sims = np.fromiter(
+                    (c.get("similarity", 0.0) for c in chunks), dtype=np.float64, count=n_chunks
+                )
+                sec_starts = np.fromiter(
+                    (s.start_line for s in sections), dtype=np.int32, count=len(sections)
+                )
+                sec_ends = np.fromiter(
+                    (s.end_line for s in sections), dtype=np.int32, count=len(sections)
+                )
+
+                overlap = (chunk_starts[:, None] <= sec_ends) & (chunk_ends[:, None] >= sec_starts)
+                best = np.where(overlap, chunk_sims[:, None], -np.inf).max(axis=0)
+                for i in np.flatnonzero(overlap.any(axis=0)):
+                    scores[sections[i].id] = float(best[i])
 
             logger.info(
-                f"Chunk-based semantic search: {len(result.get('results', []))} chunks, "
+                f"Chunk-based semantic search: {len(chunks)} chunks, "
                 f"{len(scores)} sections scored"
             )
             return scores
@@ -128,6 +183,7 @@ class SemanticScorer:
         sections: list[SectionProtocol],
         candidate_ids: set[str] | None = None,
         max_sections: int = 30,
+        top_k: int | None = None,
     ) -> dict[str, float]:
         """Calculate semantic similarity scores for sections (on-the-fly fallback path).
 
@@ -142,6 +198,8 @@ class SemanticScorer:
             candidate_ids: If provided, only embed these section IDs (e.g. top keyword hits).
             max_sections: Hard cap on sections to embed (default 30). bge-small-en-v1.5
                 takes ~0.3s per text on Railway CPU; 30 sections ≈ 3-5s.
+            top_k: If set, return only the top_k highest-scoring sections.
+                None (default) returns scores for every embedded section.
 
         Returns:
             Dictionary mapping section IDs to similarity scores (0-1).
@@ -170,25 +228,65 @@ class SemanticScorer:
             if not filtered_sections:
                 return {}
 
-            # Generate query embedding (async to avoid blocking event loop)
-            query_embedding = await self.embeddings_service.embed_text_async(query)
+            # Generate query embedding (async to avoid blocking event loop).
+            # Reuse the task pre-warmed by calculate_scores_from_chunks when
+            # it matches this query; otherwise embed fresh.
+            query_embedding: list[float] | None = None
+            if self._query_embed_task is not None and self._query_embed_text == query:
+                try:
+                    query_embedding = await self._query_embed_task
+                except Exception as e:
+                    logger.debug(f"Pre-warmed query embedding failed, re-embedding: {e}")
+                finally:
+                    self._query_embed_task = None
+                    self._query_embed_text = None
+            if query_embedding is None:
+                query_embedding = await self.embeddings_service.embed_text_async(query)
 
             # Generate section embeddings (title + truncated content)
             # Using 120 chars to reduce tokenization cost on CPU.
             # Title carries the primary semantic signal; content adds context.
             section_texts = [f"{s.title}\n{s.content[:120]}" for s in filtered_sections]
-            section_embeddings = await self.embeddings_service.embed_texts_async(section_texts)
+
+            # Only embed cache misses; stitch cached embeddings back in order
+            model_name = getattr(self.embeddings_service, "model_name", "")
+            keys = [_section_embed_key(model_name, text) for text in section_texts]
+            section_embeddings: list[list[float] | None] = []
+            for key in keys:
+                cached = _SECTION_EMBED_CACHE.get(key)
+                if cached is not None:
+                    _SECTION_EMBED_CACHE.move_to_end(key)
+                section_embeddings.append(cached)
+
+            miss_indices = [i for i, emb in enumerate(section_embeddings) if emb is None]
+            if miss_indices:
+                fresh = await self.embeddings_service.embed_texts_async(
+                    [section_texts[i] for i in miss_indices]
+                )
+                for i, embedding in zip(miss_indices, fresh):
+                    section_embeddings[i] = embedding
+                    _SECTION_EMBED_CACHE[keys[i]] = embedding
+                while len(_SECTION_EMBED_CACHE) > _SECTION_EMBED_CACHE_SIZE:
+                    _SECTION_EMBED_CACHE.popitem(last=False)
+            if miss_indices and len(miss_indices) < len(section_texts):
+                logger.debug(
+                    "Section embedding cache: %d hits, %d misses",
+                    len(section_texts) - len(miss_indices),
+                    len(miss_indices),
+                )
 
             # Calculate similarities
             similarities = self.embeddings_service.cosine_similarity(
                 query_embedding, section_embeddings
             )
 
-            # Map to section IDs
-            return {
-                section.id: similarity
-                for section, similarity in zip(filtered_sections, similarities)
-            }
+            # Map to section IDs — bulk dict(zip(...)) over plain lists beats
+            # a comprehension that touches each section object per element
+            section_ids = [s.id for s in filtered_sections]
+            if top_k is not None and top_k < len(section_ids):
+                top = heapq.nlargest(top_k, zip(similarities, section_ids))
+                return {sid: score for score, sid in top}
+            return dict(zip(section_ids, similarities))
         except Exception as e:
             logger.warning(f"Semantic search failed, falling back to empty scores: {e}")
             return {}
@@ -200,6 +298,7 @@ async def calculate_semantic_scores(
     embeddings_service: "EmbeddingsService",
     candidate_ids: set[str] | None = None,
     max_sections: int = 30,
+    top_k: int | None = None,
 ) -> dict[str, float]:
     """Convenience function for on-the-fly semantic scoring.
 
@@ -209,6 +308,7 @@ async def calculate_semantic_scores(
         embeddings_service: The embeddings service to use.
         candidate_ids: If provided, only embed these section IDs.
         max_sections: Hard cap on sections to embed.
+        top_k: If set, return only the top_k highest-scoring sections.
 
     Returns:
         Dictionary mapping section IDs to similarity scores (0-1).
@@ -222,4 +322,5 @@ async def calculate_semantic_scores(
         sections=sections,
         candidate_ids=candidate_ids,
         max_sections=max_sections,
+        top_k=top_k,
     )
@@ -4,7 +4,10 @@ This module provides a lightweight stemmer for improving keyword matching
 without external dependencies like NLTK or spaCy.
 """
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=8192)
 def stem_keyword(word: str) -> str:
     """Basic suffix stemmer to improve keyword matching.
 
@@ -16,6 +19,10 @@ def stem_keyword(word: str) -> str:
     Minimum-length guards ensure short words like "doing" (5 chars) are not
     over-stripped into meaningless 2-char stems.
 
+    Results are memoized: real corpora repeat the same keywords constantly,
+    so hot scoring loops hit the cache instead of re-running the suffix
+    checks.
+
     Args:
         word: The word to stem.
 
@@ -18,7 +18,7 @@ from .jsonrpc import (
     jsonrpc_error,
     jsonrpc_response,
 )
-from .tool_defs import TOOL_DEFINITIONS
+from .tool_defs import TOOL_DEFINITIONS, TOOL_DEFINITIONS_JSON
 
 # Note: validate_request requires config and is not imported at module level.
 # Import directly when needed: from src.mcp.validation import validate_request
@@ -26,6 +26,7 @@ from .tool_defs import TOOL_DEFINITIONS
 __all__ = [
     # Tool definitions
     "TOOL_DEFINITIONS",
+    "TOOL_DEFINITIONS_JSON",
     # JSON-RPC helpers
     "jsonrpc_response",
     "jsonrpc_error",
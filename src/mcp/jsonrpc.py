@@ -6,8 +6,14 @@ responses and errors according to the specification.
 See: https://www.jsonrpc.org/specification
 """
 
+import sys
 from typing import Any
 
+# Shared version-string object for every envelope. "2.0" contains a dot so
+# CPython does not auto-intern it; interning once keeps all responses
+# pointing at a single object instead of one cached literal per module.
+_JSONRPC_VERSION = sys.intern("2.0")
+
 
 def jsonrpc_response(id: Any, result: Any) -> dict:
     """Create a JSON-RPC 2.0 success response.
@@ -19,7 +25,7 @@ def jsonrpc_response(id: Any, result: Any) -> dict:
     Returns:
         JSON-RPC 2.0 response dict
     """
-    return {"jsonrpc": "2.0", "id": id, "result": result}
+    return {"jsonrpc": _JSONRPC_VERSION, "id": id, "result": result}
 
 
 def jsonrpc_error(id: Any, code: int, message: str) -> dict:
@@ -41,7 +47,11 @@ def jsonrpc_error(id: Any, code: int, message: str) -> dict:
     Returns:
         JSON-RPC 2.0 error response dict
     """
-    return {"jsonrpc": "2.0", "id": id, "error": {"code": code, "message": message}}
+    return {
+        "jsonrpc": _JSONRPC_VERSION,
+        "id": id,
+        "error": {"code": code, "message": message},
+    }
 
 
 # Standard JSON-RPC error codes
@@ -9,7 +9,7 @@ Tool Categories:
     - Team Queries: rlm_multi_project_query (requires team API key)
     - Session Management: rlm_inject, rlm_context, rlm_clear_context
     - Metadata: rlm_stats, rlm_sections, rlm_settings
-    - Summaries: rlm_store_summary, rlm_get_summaries, rlm_delete_summary
+    - Summaries: rlm_store_summary, rlm_store_summary_bulk, rlm_get_summaries, rlm_delete_summary
     - Shared Context: rlm_shared_context, rlm_list_templates, rlm_get_template
     - Agent Memory: rlm_remember, rlm_recall, rlm_memories, rlm_forget
     - Multi-Agent Swarm: rlm_swarm_*, rlm_claim, rlm_release, rlm_state_*, rlm_task_*
@@ -25,6 +25,7 @@ Tool Tiers:
     - ADVANCED (🔴): Multi-agent swarms and expert orchestration
 """
 
+import json
 from enum import StrEnum
 
 
@@ -38,6 +39,17 @@ class ToolTier(StrEnum):
     ADVANCED = "advanced"  # Multi-agent swarms and orchestration
 
 
+# Enum value lists repeated across several tool schemas. Shared here so the
+# schemas reference one object each (less duplication to drift, smaller
+# resident footprint) — serialized output is unchanged.
+# Bare string property schema, the most common fragment (~70 copies before
+# sharing). Treated as immutable — never mutate through these references.
+_STR = {"type": "string"}
+_SEARCH_MODES = ["keyword", "semantic", "hybrid"]
+_MEMORY_TYPES = ["fact", "decision", "learning", "preference", "todo", "context"]
+_MEMORY_SCOPES = ["agent", "project", "team", "user"]
+
+
 # Mapping of tool name -> tier for discovery and filtering
 TOOL_TIERS: dict[str, ToolTier] = {
     # PRIMARY (🟢) - Essential tools, start here
@@ -55,6 +67,7 @@ TOOL_TIERS: dict[str, ToolTier] = {
     "rlm_remember": ToolTier.POWER_USER,
     "rlm_remember_bulk": ToolTier.POWER_USER,
     "rlm_store_summary": ToolTier.POWER_USER,
+    "rlm_store_summary_bulk": ToolTier.POWER_USER,
     "rlm_get_summaries": ToolTier.POWER_USER,
     "rlm_load_document": ToolTier.POWER_USER,
     "rlm_memories": ToolTier.POWER_USER,
@@ -174,7 +187,7 @@ TOOL_DEFINITIONS: list[dict] = [
                 },
                 "search_mode": {
                     "type": "string",
-                    "enum": ["keyword", "semantic", "hybrid"],
+                    "enum": _SEARCH_MODES,
                     "default": "hybrid",
                 },
                 "include_metadata": {"type": "boolean", "default": True},
@@ -213,7 +226,7 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "pattern": {"type": "string"},
+                "pattern": _STR,
                 "max_results": {"type": "integer", "default": 20},
             },
             "required": ["pattern"],
@@ -235,7 +248,7 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "query": {"type": "string"},
+                "query": _STR,
                 "max_depth": {"type": "integer", "default": 2, "minimum": 1, "maximum": 5},
             },
             "required": ["query"],
@@ -252,7 +265,7 @@ TOOL_DEFINITIONS: list[dict] = [
                     "items": {
                         "type": "object",
                         "properties": {
-                            "query": {"type": "string"},
+                            "query": _STR,
                             "max_tokens": {"type": "integer"},
                         },
                         "required": ["query"],
@@ -305,17 +318,17 @@ TOOL_DEFINITIONS: list[dict] = [
                 "per_project_limit": {"type": "integer", "default": 3, "minimum": 1, "maximum": 20},
                 "project_ids": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Optional project IDs/slugs to include",
                 },
                 "exclude_project_ids": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Optional project IDs/slugs to exclude",
                 },
                 "search_mode": {
                     "type": "string",
-                    "enum": ["keyword", "semantic", "hybrid"],
+                    "enum": _SEARCH_MODES,
                     "default": "keyword",
                 },
                 "include_metadata": {"type": "boolean", "default": True},
@@ -331,7 +344,7 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "context": {"type": "string"},
+                "context": _STR,
                 "append": {"type": "boolean", "default": False},
             },
             "required": ["context"],
@@ -427,30 +440,68 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "document_path": {"type": "string"},
-                "summary": {"type": "string"},
+                "document_path": _STR,
+                "summary": _STR,
                 "summary_type": {
                     "type": "string",
                     "enum": ["concise", "detailed", "technical", "keywords", "custom"],
                     "default": "concise",
                 },
-                "generated_by": {"type": "string"},
+                "generated_by": _STR,
             },
             "required": ["document_path", "summary"],
         },
     },
+    {
+        "name": "rlm_store_summary_bulk",
+        "description": "Store many LLM-generated summaries in one batch insert. Existing (document, type, section) summaries are skipped, not updated.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "summaries": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "document_path": _STR,
+                            "summary": _STR,
+                            "summary_type": {
+                                "type": "string",
+                                "enum": ["concise", "detailed", "technical", "keywords", "custom"],
+                                "default": "concise",
+                            },
+                            "section_id": _STR,
+                            "line_start": {"type": "integer"},
+                            "line_end": {"type": "integer"},
+                            "generated_by": _STR,
+                        },
+                        "required": ["document_path", "summary"],
+                    },
+                    "minItems": 1,
+                    "description": "Array of summaries to store",
+                },
+            },
+            "required": ["summaries"],
+        },
+    },
     {
         "name": "rlm_get_summaries",
         "description": "Retrieve stored summaries.",
         "inputSchema": {
             "type": "object",
             "properties": {
-                "document_path": {"type": "string"},
+                "document_path": _STR,
                 "summary_type": {
                     "type": "string",
                     "enum": ["concise", "detailed", "technical", "keywords", "custom"],
                 },
                 "include_content": {"type": "boolean", "default": True},
+                "count_only": {"type": "boolean", "default": False},
+                "order_by": {
+                    "type": "string",
+                    "enum": ["created_desc", "none"],
+                    "default": "created_desc",
+                },
             },
             "required": [],
         },
@@ -460,7 +511,7 @@ TOOL_DEFINITIONS: list[dict] = [
         "description": "Delete stored summaries.",
         "inputSchema": {
             "type": "object",
-            "properties": {"summary_id": {"type": "string"}, "document_path": {"type": "string"}},
+            "properties": {"summary_id": _STR, "document_path": _STR},
             "required": [],
         },
     },
@@ -515,7 +566,7 @@ TOOL_DEFINITIONS: list[dict] = [
                 "slug": {"type": "string", "description": "Template slug"},
                 "variables": {
                     "type": "object",
-                    "additionalProperties": {"type": "string"},
+                    "additionalProperties": _STR,
                     "description": "Variables to substitute in template",
                 },
             },
@@ -554,7 +605,7 @@ TOOL_DEFINITIONS: list[dict] = [
                 },
                 "tags": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Tags for filtering and organization",
                 },
                 "priority": {
@@ -582,12 +633,12 @@ TOOL_DEFINITIONS: list[dict] = [
                 },
                 "type": {
                     "type": "string",
-                    "enum": ["fact", "decision", "learning", "preference", "todo", "context"],
+                    "enum": _MEMORY_TYPES,
                     "default": "fact",
                 },
                 "scope": {
                     "type": "string",
-                    "enum": ["agent", "project", "team", "user"],
+                    "enum": _MEMORY_SCOPES,
                     "default": "project",
                 },
                 "category": {"type": "string", "description": "Optional category for grouping"},
@@ -597,12 +648,12 @@ TOOL_DEFINITIONS: list[dict] = [
                 },
                 "related_to": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "IDs of related memories",
                 },
                 "document_refs": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Referenced document paths",
                 },
             },
@@ -623,25 +674,18 @@ TOOL_DEFINITIONS: list[dict] = [
                             "text": {"type": "string", "description": "Memory text to store"},
                             "type": {
                                 "type": "string",
-                                "enum": [
-                                    "fact",
-                                    "decision",
-                                    "learning",
-                                    "preference",
-                                    "todo",
-                                    "context",
-                                ],
+                                "enum": _MEMORY_TYPES,
                                 "default": "fact",
                             },
                             "scope": {
                                 "type": "string",
-                                "enum": ["agent", "project", "team", "user"],
+                                "enum": _MEMORY_SCOPES,
                                 "default": "project",
                             },
-                            "category": {"type": "string"},
+                            "category": _STR,
                             "ttl_days": {"type": "integer"},
-                            "related_to": {"type": "array", "items": {"type": "string"}},
-                            "document_refs": {"type": "array", "items": {"type": "string"}},
+                            "related_to": {"type": "array", "items": _STR},
+                            "document_refs": {"type": "array", "items": _STR},
                         },
                         "required": ["text"],
                     },
@@ -662,9 +706,9 @@ TOOL_DEFINITIONS: list[dict] = [
                 "query": {"type": "string", "description": "Search query"},
                 "type": {
                     "type": "string",
-                    "enum": ["fact", "decision", "learning", "preference", "todo", "context"],
+                    "enum": _MEMORY_TYPES,
                 },
-                "scope": {"type": "string", "enum": ["agent", "project", "team", "user"]},
+                "scope": {"type": "string", "enum": _MEMORY_SCOPES},
                 "category": {"type": "string", "description": "Filter by category"},
                 "limit": {
                     "type": "integer",
@@ -688,10 +732,10 @@ TOOL_DEFINITIONS: list[dict] = [
             "properties": {
                 "type": {
                     "type": "string",
-                    "enum": ["fact", "decision", "learning", "preference", "todo", "context"],
+                    "enum": _MEMORY_TYPES,
                 },
-                "scope": {"type": "string", "enum": ["agent", "project", "team", "user"]},
-                "category": {"type": "string"},
+                "scope": {"type": "string", "enum": _MEMORY_SCOPES},
+                "category": _STR,
                 "search": {"type": "string", "description": "Text search in content"},
                 "limit": {"type": "integer", "default": 20},
                 "offset": {"type": "integer", "default": 0},
@@ -720,7 +764,7 @@ TOOL_DEFINITIONS: list[dict] = [
                 "memory_id": {"type": "string", "description": "Specific memory ID to delete"},
                 "type": {
                     "type": "string",
-                    "enum": ["fact", "decision", "learning", "preference", "todo", "context"],
+                    "enum": _MEMORY_TYPES,
                 },
                 "category": {"type": "string", "description": "Delete all in this category"},
                 "older_than_days": {
@@ -821,7 +865,7 @@ TOOL_DEFINITIONS: list[dict] = [
                 },
                 "tags": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Optional tags for categorization",
                 },
             },
@@ -988,12 +1032,12 @@ TOOL_DEFINITIONS: list[dict] = [
                 },
                 "dos": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "List of things to do",
                 },
                 "donts": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "List of things to avoid",
                 },
                 "custom_fields": {
@@ -1026,7 +1070,7 @@ TOOL_DEFINITIONS: list[dict] = [
             "type": "object",
             "properties": {
                 "name": {"type": "string", "description": "Swarm name"},
-                "description": {"type": "string"},
+                "description": _STR,
                 "max_agents": {"type": "integer", "default": 10},
                 "config": {"type": "object"},
             },
@@ -1046,7 +1090,7 @@ TOOL_DEFINITIONS: list[dict] = [
                     "enum": ["coordinator", "worker", "observer"],
                     "default": "worker",
                 },
-                "capabilities": {"type": "array", "items": {"type": "string"}},
+                "capabilities": {"type": "array", "items": _STR},
             },
             "required": ["swarm_id", "agent_id"],
         },
@@ -1078,7 +1122,7 @@ TOOL_DEFINITIONS: list[dict] = [
                         "display_name": {"type": "string", "description": "Display name (e.g., 'Jarvis ⚡')"},
                         "personality": {"type": "string", "description": "Personality type (e.g., 'INTJ - Strategic')"},
                         "role_description": {"type": "string", "description": "Role description"},
-                        "boundaries": {"type": "array", "items": {"type": "string"}, "description": "Boundaries and limits"},
+                        "boundaries": {"type": "array", "items": _STR, "description": "Boundaries and limits"},
                         "communication_style": {"type": "string", "description": "Preferred communication style"},
                         "decision_making": {"type": "string", "description": "Decision-making approach"},
                         "soul_document_path": {"type": "string", "description": "Path to SOUL.md document"},
@@ -1095,8 +1139,8 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "swarm_id": {"type": "string"},
-                "agent_id": {"type": "string"},
+                "swarm_id": _STR,
+                "agent_id": _STR,
                 "resource_type": {
                     "type": "string",
                     "enum": ["file", "function", "module", "component", "other"],
@@ -1116,11 +1160,11 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "swarm_id": {"type": "string"},
-                "agent_id": {"type": "string"},
-                "claim_id": {"type": "string"},
-                "resource_type": {"type": "string"},
-                "resource_id": {"type": "string"},
+                "swarm_id": _STR,
+                "agent_id": _STR,
+                "claim_id": _STR,
+                "resource_type": _STR,
+                "resource_id": _STR,
             },
             "required": ["swarm_id", "agent_id"],
         },
@@ -1131,7 +1175,7 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "swarm_id": {"type": "string"},
+                "swarm_id": _STR,
                 "key": {"type": "string", "description": "State key to read"},
             },
             "required": ["swarm_id", "key"],
@@ -1143,9 +1187,9 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "swarm_id": {"type": "string"},
-                "agent_id": {"type": "string"},
-                "key": {"type": "string"},
+                "swarm_id": _STR,
+                "agent_id": _STR,
+                "key": _STR,
                 "value": {"description": "Value to set (any JSON-serializable type)"},
                 "expected_version": {
                     "type": "integer",
@@ -1168,7 +1212,7 @@ TOOL_DEFINITIONS: list[dict] = [
                 "swarm_id": {"type": "string", "description": "Swarm ID"},
                 "keys": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "List of state keys to monitor",
                 },
                 "last_versions": {
@@ -1187,8 +1231,8 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "swarm_id": {"type": "string"},
-                "agent_id": {"type": "string"},
+                "swarm_id": _STR,
+                "agent_id": _STR,
                 "event_type": {"type": "string", "description": "Event type"},
                 "payload": {"type": "object", "description": "Event data"},
             },
@@ -1201,7 +1245,7 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "swarm_id": {"type": "string"},
+                "swarm_id": _STR,
                 "event_type": {
                     "type": "string",
                     "description": "Filter by event type",
@@ -1230,10 +1274,10 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "swarm_id": {"type": "string"},
-                "agent_id": {"type": "string"},
-                "title": {"type": "string"},
-                "description": {"type": "string"},
+                "swarm_id": _STR,
+                "agent_id": _STR,
+                "title": _STR,
+                "description": _STR,
                 "priority": {
                     "type": "integer",
                     "default": 0,
@@ -1246,7 +1290,7 @@ TOOL_DEFINITIONS: list[dict] = [
                 },
                 "depends_on": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Task IDs this depends on",
                 },
                 "metadata": {"type": "object"},
@@ -1264,8 +1308,8 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "swarm_id": {"type": "string"},
-                "agent_id": {"type": "string"},
+                "swarm_id": _STR,
+                "agent_id": _STR,
                 "tasks": {
                     "type": "array",
                     "description": "Array of task objects (max 50)",
@@ -1273,8 +1317,8 @@ TOOL_DEFINITIONS: list[dict] = [
                     "items": {
                         "type": "object",
                         "properties": {
-                            "title": {"type": "string"},
-                            "description": {"type": "string"},
+                            "title": _STR,
+                            "description": _STR,
                             "priority": {
                                 "type": "integer",
                                 "default": 0,
@@ -1287,7 +1331,7 @@ TOOL_DEFINITIONS: list[dict] = [
                             },
                             "depends_on": {
                                 "type": "array",
-                                "items": {"type": "string"},
+                                "items": _STR,
                                 "description": "Task IDs this depends on",
                             },
                             "metadata": {"type": "object"},
@@ -1309,8 +1353,8 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "swarm_id": {"type": "string"},
-                "agent_id": {"type": "string"},
+                "swarm_id": _STR,
+                "agent_id": _STR,
                 "task_id": {"type": "string", "description": "Specific task to claim (optional)"},
                 "timeout_seconds": {"type": "integer", "default": 600},
             },
@@ -1323,9 +1367,9 @@ TOOL_DEFINITIONS: list[dict] = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "swarm_id": {"type": "string"},
-                "agent_id": {"type": "string"},
-                "task_id": {"type": "string"},
+                "swarm_id": _STR,
+                "agent_id": _STR,
+                "task_id": _STR,
                 "success": {"type": "boolean", "default": True},
                 "result": {"description": "Task result data"},
             },
@@ -1760,8 +1804,8 @@ updated within the threshold. Use dry_run=true to preview before recovering.""",
                     "items": {
                         "type": "object",
                         "properties": {
-                            "path": {"type": "string"},
-                            "content": {"type": "string"},
+                            "path": _STR,
+                            "content": _STR,
                         },
                         "required": ["path", "content"],
                     },
@@ -1825,7 +1869,7 @@ admins can approve or deny via the dashboard.""",
                 },
                 "paths_filter": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Only include files matching these path prefixes (e.g., ['docs/', 'src/'])",
                 },
                 "include_content": {
@@ -1856,7 +1900,7 @@ admins can approve or deny via the dashboard.""",
                 },
                 "search_mode": {
                     "type": "string",
-                    "enum": ["keyword", "semantic", "hybrid"],
+                    "enum": _SEARCH_MODES,
                     "default": "hybrid",
                 },
             },
@@ -1902,7 +1946,7 @@ Returns context_data (files + sections), setup_code (helper functions), and usag
                 },
                 "search_mode": {
                     "type": "string",
-                    "enum": ["keyword", "semantic", "hybrid"],
+                    "enum": _SEARCH_MODES,
                     "default": "hybrid",
                     "description": "Search mode when query is provided",
                 },
@@ -1972,7 +2016,7 @@ Use for:
                 },
                 "alternatives": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "List of alternatives that were considered",
                 },
                 "revert_plan": {
@@ -1981,7 +2025,7 @@ Use for:
                 },
                 "tags": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Tags for categorization (e.g., ['architecture', 'caching', 'performance'])",
                 },
             },
@@ -2017,7 +2061,7 @@ Returns decisions sorted by recency with supersession chain info.""",
                 },
                 "tags": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Filter by tags (OR logic)",
                 },
                 "limit": {
@@ -2078,7 +2122,7 @@ The old decision is marked as SUPERSEDED with a link to the new decision.""",
                 },
                 "alternatives": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Alternatives considered for the new decision",
                 },
                 "revert_plan": {
@@ -2087,7 +2131,7 @@ The old decision is marked as SUPERSEDED with a link to the new decision.""",
                 },
                 "tags": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Tags for the new decision",
                 },
             },
@@ -2217,7 +2261,7 @@ Tasks have owners, priorities, acceptance criteria, and evidence requirements.""
                 },
                 "context_refs": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Context references (URLs, file paths)",
                 },
                 "context_query": {
@@ -2253,12 +2297,12 @@ Creates a feature (N1) with automatic N2 workstreams: API, FRONTEND, QA, BUGFIX_
                 "parent_id": {"type": "string", "description": "Optional N0 parent"},
                 "workstreams": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Workstream types to create (defaults to standard set)",
                 },
                 "workstream_owners": {
                     "type": "object",
-                    "additionalProperties": {"type": "string"},
+                    "additionalProperties": _STR,
                     "description": "Map of workstream type to owner (e.g., {'API': 'dev1', 'FRONTEND': 'dev2'})",
                 },
             },
@@ -2388,7 +2432,7 @@ Automatically creates a linked memory with task outcome, learnings, and decision
                 },
                 "learnings": {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _STR,
                     "description": "Lessons learned from this task",
                 },
                 "decision_impact": {
@@ -2571,3 +2615,9 @@ Returns events, closures, blocks since the specified timestamp.""",
         },
     },
 ]
+
+# TOOL_DEFINITIONS serialized once at import (compact separators). The list
+# is static for the process lifetime, so tools/list responses can splice
+# these bytes into the JSON-RPC envelope instead of re-encoding ~2.5K lines
+# of schema dicts per request.
+TOOL_DEFINITIONS_JSON: bytes = json.dumps(TOOL_DEFINITIONS, separators=(",", ":")).encode()
@@ -4,6 +4,10 @@ This module handles authentication validation and usage limit checks
 for MCP requests. Supports both API keys and OAuth tokens.
 """
 
+import hashlib
+import time
+from collections import OrderedDict
+
 from ..auth import (
     get_effective_plan,
     get_project_with_team,
@@ -19,8 +23,87 @@ from ..usage import (
     check_usage_limits,
     is_scan_blocked,
     log_security_event,
+    scan_identifier,
 )
 
+# Short-TTL cache of successful credential resolution. Every MCP call was
+# paying 2-3 DB round-trips (token/key lookup + project/team fetch) before
+# doing any work; a 60s window skips those for repeat callers while rate
+# limits and usage checks still run on every request. Keys are hashed so
+# raw credentials never sit in memory beyond the request. TTL is kept well
+# below OAuth token lifetimes; revoke/rotate paths should call
+# invalidate_auth_cache to drop entries immediately.
+_AUTH_CACHE_TTL = 60.0
+_AUTH_CACHE_SIZE = 10_000
+# cache_key -> (expires_at, auth_info, plan, actual_project_id, rate_limit_plan)
+_auth_cache: OrderedDict[str, tuple[float, dict, Plan, str, str]] = OrderedDict()
+
+# Negative cache of recently-rejected credentials. Scan storms replay the
+# same bad keys; remembering the rejection for 30s answers repeats without
+# touching Redis or the DB. Kept separate from the positive cache (strictly
+# bounded, shorter TTL) so an attacker churning invalid keys can only evict
+# other rejections, never legitimate entries.
+_NEG_CACHE_TTL = 30.0
+_NEG_CACHE_SIZE = 50_000
+# cache_key -> (expires_at, error_message)
+_neg_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+# Monthly usage counters move slowly relative to request rate; caching the
+# check for a few seconds turns a per-request DB aggregate into one query
+# every few seconds per project. Worst case a project bursts a few requests
+# past its monthly limit within the TTL — bounded, acceptable staleness.
+_USAGE_CACHE_TTL = 3.0
+_USAGE_CACHE_SIZE = 50_000
+# project_id -> (expires_at, limits)
+_usage_cache: OrderedDict[str, tuple[float, object]] = OrderedDict()
+
+# Error strings built once at import. These fire hardest during scan storms
+# and rate-limit bursts, so the failure path should not re-format anything.
+# Plan rate limits come from settings, fixed at startup, so the per-plan
+# messages can be prebuilt as well.
+_ERR_SCAN_BLOCKED = "Too many failed requests. Try again later."
+_ERR_OAUTH_INVALID = "Invalid or expired OAuth token. Re-authenticate at https://snipara.com/dashboard or run /snipara:quickstart"
+_ERR_CLIENT_KEY_INVALID = "Invalid client API key. Contact your integrator for access."
+_ERR_API_KEY_INVALID = "Invalid API key. Get a free key at https://snipara.com/dashboard (100 queries/month, no credit card)"
+_ERR_PROJECT_NOT_FOUND = "Project not found"
+_ERR_RATE_LIMITED = {
+    plan: f"Rate limit exceeded: {limit}/min"
+    for plan, limit in settings.plan_rate_limits.items()
+}
+_ERR_RATE_LIMITED_DEFAULT = f"Rate limit exceeded: {settings.rate_limit_requests}/min"
+
+
+def _cache_negative(cache_key: str, error: str) -> None:
+    """Remember a rejected credential so repeats short-circuit."""
+    _neg_cache[cache_key] = (time.monotonic() + _NEG_CACHE_TTL, error)
+    _neg_cache.move_to_end(cache_key)
+    while len(_neg_cache) > _NEG_CACHE_SIZE:
+        _neg_cache.popitem(last=False)
+
+
+def _auth_cache_key(api_key: str, project_id_or_slug: str) -> str:
+    """Cache key from hashed credential + project identifier."""
+    digest = hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+    return f"{digest}:{project_id_or_slug}"
+
+
+def invalidate_auth_cache(api_key: str | None = None) -> None:
+    """Drop cached auth entries for a key, or all entries if no key given.
+
+    Call from revoke/rotate flows so a dead credential stops working
+    within the request, not after the TTL lapses.
+    """
+    if api_key is None:
+        _auth_cache.clear()
+        _neg_cache.clear()
+        return
+    digest = hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+    prefix = f"{digest}:"
+    for key in [k for k in _auth_cache if k.startswith(prefix)]:
+        del _auth_cache[key]
+    for key in [k for k in _neg_cache if k.startswith(prefix)]:
+        del _neg_cache[key]
+
 
 async def validate_request(
     project_id_or_slug: str, api_key: str, client_ip: str | None = None
@@ -41,76 +124,89 @@ async def validate_request(
         - error_message: Error string if validation failed, None if success
         - actual_project_id: Database ID (not slug) for operations
     """
-    # Anti-scan check
-    key_prefix = api_key[:12]
-    if await is_scan_blocked(key_prefix):
-        log_security_event("scan.blocked", "api_key", key_prefix, key_prefix)
-        return None, Plan.FREE, "Too many failed requests. Try again later.", None
-
-    auth_info = None
-
-    # Check if it's an OAuth token
-    if api_key.startswith("snipara_at_"):
-        auth_info = await validate_oauth_token(api_key, project_id_or_slug)
-        if not auth_info:
-            return (
-                None,
-                Plan.FREE,
-                "Invalid or expired OAuth token. Re-authenticate at https://snipara.com/dashboard or run /snipara:quickstart",
-                None,
-            )
-    # Check if it's an integrator client key
-    elif api_key.startswith("snipara_ic_"):
-        auth_info = await validate_client_api_key(api_key, project_id_or_slug)
-        if not auth_info:
-            return (
-                None,
-                Plan.FREE,
-                "Invalid client API key. Contact your integrator for access.",
-                None,
-            )
+    cache_key = _auth_cache_key(api_key, project_id_or_slug)
+
+    # Known-bad credential seen within the negative TTL: reject without
+    # touching Redis (anti-scan) or the DB at all.
+    neg = _neg_cache.get(cache_key)
+    if neg is not None and neg[0] > time.monotonic():
+        return None, Plan.FREE, neg[1], None
+
+    # Anti-scan check (hashed key prefix, never raw credential material)
+    scan_id = scan_identifier(api_key)
+    if await is_scan_blocked(scan_id):
+        log_security_event("scan.blocked", "api_key", scan_id, scan_id)
+        return None, Plan.FREE, _ERR_SCAN_BLOCKED, None
+
+    now = time.monotonic()
+    cached = _auth_cache.get(cache_key)
+    if cached is not None and cached[0] > now:
+        _auth_cache.move_to_end(cache_key)
+        _, auth_info, plan, actual_project_id, rate_limit_plan = cached
     else:
-        # Fall back to API key validation
-        auth_info = await validate_api_key(api_key, project_id_or_slug)
-        if not auth_info:
-            return (
-                None,
-                Plan.FREE,
-                "Invalid API key. Get a free key at https://snipara.com/dashboard (100 queries/month, no credit card)",
-                None,
-            )
-
-    project = await get_project_with_team(project_id_or_slug)
-    if not project:
-        return None, Plan.FREE, "Project not found", None
-
-    # Use actual database ID for all operations
-    actual_project_id = project.id
-
-    # Determine plan BEFORE rate limit check (plan-based limits)
-    plan = get_effective_plan(project.team.subscription if project.team else None)
-
-    # Use PARTNER rate limits for integrator clients (higher limits for heavy polling)
-    # This applies both when:
-    # 1. Using snipara_ic_* client API key (auth_type == "integrator_client")
-    # 2. Using regular rlm_* API key on a project that belongs to an integrator client
-    rate_limit_plan = plan.value
-    if auth_info.get("auth_type") == "integrator_client":
-        rate_limit_plan = "PARTNER"
-    elif auth_info.get("is_integrator_project"):
-        # Regular API key on an integrator project also gets PARTNER limits
-        rate_limit_plan = "PARTNER"
+        auth_info = None
+
+        # Check if it's an OAuth token
+        if api_key.startswith("snipara_at_"):
+            auth_info = await validate_oauth_token(api_key, project_id_or_slug)
+            if not auth_info:
+                _cache_negative(cache_key, _ERR_OAUTH_INVALID)
+                return None, Plan.FREE, _ERR_OAUTH_INVALID, None
+        # Check if it's an integrator client key
+        elif api_key.startswith("snipara_ic_"):
+            auth_info = await validate_client_api_key(api_key, project_id_or_slug)
+            if not auth_info:
+                _cache_negative(cache_key, _ERR_CLIENT_KEY_INVALID)
+                return None, Plan.FREE, _ERR_CLIENT_KEY_INVALID, None
+        else:
+            # Fall back to API key validation
+            auth_info = await validate_api_key(api_key, project_id_or_slug)
+            if not auth_info:
+                _cache_negative(cache_key, _ERR_API_KEY_INVALID)
+                return None, Plan.FREE, _ERR_API_KEY_INVALID, None
+
+        project = await get_project_with_team(project_id_or_slug)
+        if not project:
+            _cache_negative(cache_key, _ERR_PROJECT_NOT_FOUND)
+            return None, Plan.FREE, _ERR_PROJECT_NOT_FOUND, None
+
+        # Use actual database ID for all operations
+        actual_project_id = project.id
+
+        # Determine plan BEFORE rate limit check (plan-based limits)
+        plan = get_effective_plan(project.team.subscription if project.team else None)
+
+        # Use PARTNER rate limits for integrator clients (higher limits for heavy polling)
+        # This applies both when:
+        # 1. Using snipara_ic_* client API key (auth_type == "integrator_client")
+        # 2. Using regular rlm_* API key on a project that belongs to an integrator client
+        rate_limit_plan = plan.value
+        if auth_info.get("auth_type") == "integrator_client":
+            rate_limit_plan = "PARTNER"
+        elif auth_info.get("is_integrator_project"):
+            # Regular API key on an integrator project also gets PARTNER limits
+            rate_limit_plan = "PARTNER"
+
+        _auth_cache[cache_key] = (
+            now + _AUTH_CACHE_TTL,
+            auth_info,
+            plan,
+            actual_project_id,
+            rate_limit_plan,
+        )
+        _auth_cache.move_to_end(cache_key)
+        while len(_auth_cache) > _AUTH_CACHE_SIZE:
+            _auth_cache.popitem(last=False)
 
     # Check rate limit with plan-based limits
     if not await check_rate_limit(auth_info["id"], client_ip=client_ip, plan=rate_limit_plan):
-        max_requests = settings.plan_rate_limits.get(rate_limit_plan, settings.rate_limit_requests)
         log_security_event(
             "rate_limit.exceeded",
             "api_key",
             auth_info["id"],
             auth_info.get("user_id", auth_info["id"]),
         )
-        return None, plan, f"Rate limit exceeded: {max_requests}/min", None
+        return None, plan, _ERR_RATE_LIMITED.get(rate_limit_plan, _ERR_RATE_LIMITED_DEFAULT), None
 
     # Check bundle limits for integrator clients
     if auth_info.get("auth_type") == "integrator_client":
@@ -133,8 +229,16 @@ async def validate_request(
                     None,
                 )
     else:
-        # Standard usage limits for non-integrator clients
-        limits = await check_usage_limits(actual_project_id, plan)
+        # Standard usage limits for non-integrator clients (short-TTL cached)
+        cached_limits = _usage_cache.get(actual_project_id)
+        if cached_limits is not None and cached_limits[0] > time.monotonic():
+            limits = cached_limits[1]
+        else:
+            limits = await check_usage_limits(actual_project_id, plan)
+            _usage_cache[actual_project_id] = (time.monotonic() + _USAGE_CACHE_TTL, limits)
+            _usage_cache.move_to_end(actual_project_id)
+            while len(_usage_cache) > _USAGE_CACHE_SIZE:
+                _usage_cache.popitem(last=False)
         if limits.exceeded:
             return None, plan, f"Monthly limit exceeded: {limits.current}/{limits.max}", None
 
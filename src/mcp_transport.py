@@ -48,7 +48,7 @@ from typing import Any
 from fastapi import APIRouter, Header, HTTPException, Request
 from fastapi.responses import JSONResponse, Response, StreamingResponse
 
-from .mcp import TOOL_DEFINITIONS, jsonrpc_error, jsonrpc_response
+from .mcp import TOOL_DEFINITIONS, TOOL_DEFINITIONS_JSON, jsonrpc_error, jsonrpc_response
 from .mcp.validation import validate_request
 from .models import Plan, ToolName
 from .rlm_engine import RLMEngine
@@ -74,6 +74,10 @@ router = APIRouter(prefix="/mcp", tags=["MCP Transport"])
 #: MCP protocol version (spec: 2024-11-05)
 MCP_VERSION = "2024-11-05"
 
+#: tools/list result built once — TOOL_DEFINITIONS is immutable after import,
+#: so there's no reason to rebuild the wrapper dict per handshake.
+_TOOLS_LIST_RESULT = {"tools": TOOL_DEFINITIONS}
+
 
 # ============ REQUEST HANDLERS ============
 
@@ -187,7 +191,7 @@ async def handle_request(
             },
         )
     elif method == "tools/list":
-        return jsonrpc_response(id, {"tools": TOOL_DEFINITIONS})
+        return jsonrpc_response(id, _TOOLS_LIST_RESULT)
     elif method == "tools/call":
         return await handle_call_tool(id, params, project_id, plan, access_level, user_id)
     elif method == "ping":
@@ -278,6 +282,23 @@ async def mcp_endpoint(
         ]
         return JSONResponse(responses)
 
+    # tools/list fast path: splice the pre-serialized definitions into the
+    # envelope so the ~100-tool schema list isn't re-encoded per request.
+    # Auth has already run; only the request id varies between responses.
+    if (
+        isinstance(body, dict)
+        and body.get("method") == "tools/list"
+        and body.get("id") is not None
+    ):
+        payload = (
+            b'{"jsonrpc":"2.0","id":'
+            + json.dumps(body["id"]).encode()
+            + b',"result":{"tools":'
+            + TOOL_DEFINITIONS_JSON
+            + b"}}"
+        )
+        return Response(content=payload, media_type="application/json")
+
     response = await handle_request(body, actual_project_id, plan, access_level, user_id)
     return JSONResponse(response) if response else Response(status_code=204)
 
@@ -3,10 +3,19 @@
 Adds security headers to all HTTP responses using pure ASGI pattern.
 """
 
-from uuid import uuid4
+import os
 
 from ..config import settings
 
+# Constant portion of the security headers, built once. Only x-request-id
+# (per request) and HSTS (debug toggle) vary.
+_STATIC_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+)
+_HSTS_HEADER = (b"strict-transport-security", b"max-age=31536000; includeSubDomains")
+
 
 class SecurityHeadersMiddleware:
     """
@@ -31,23 +40,25 @@ class SecurityHeadersMiddleware:
             await self.app(scope, receive, send)
             return
 
-        # Generate request ID for tracing
-        request_id = str(uuid4())
+        # Request ID for tracing: forward the proxy's X-Request-Id when one
+        # arrived, else generate. os.urandom(16).hex() gives the same 128
+        # bits of randomness as uuid4 without the UUID object construction
+        # and dash formatting — this runs on every request including health
+        # probes.
+        request_id = next(
+            (v for k, v in scope.get("headers", ()) if k == b"x-request-id"), None
+        ) or os.urandom(16).hex().encode()
 
         async def send_with_headers(message):
             if message["type"] == "http.response.start":
                 headers = list(message.get("headers", []))
                 # Add security headers
-                headers.append((b"x-request-id", request_id.encode()))
-                headers.append((b"x-content-type-options", b"nosniff"))
-                headers.append((b"x-frame-options", b"DENY"))
-                headers.append((b"x-xss-protection", b"1; mode=block"))
+                headers.append((b"x-request-id", request_id))
+                headers.extend(_STATIC_HEADERS)
 
                 # Add HSTS in production (non-debug mode)
                 if not settings.debug:
-                    headers.append(
-                        (b"strict-transport-security", b"max-age=31536000; includeSubDomains")
-                    )
+                    headers.append(_HSTS_HEADER)
 
                 message = {**message, "headers": headers}
             await send(message)
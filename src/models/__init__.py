@@ -1,157 +1,290 @@
 """Pydantic models for RLM MCP Server request/response schemas.
 
-This module re-exports all models for backward compatibility.
-Import from submodules directly for cleaner imports:
+This module re-exports all models for backward compatibility, but loads
+each submodule lazily (PEP 562): pydantic model construction only runs
+for the submodules a process actually touches. Import from submodules
+directly for cleaner imports:
 
     from src.models.enums import ToolName, Plan
     from src.models.context import ContextQueryResult
 """
 
-# ============ ENUMS ============
-# ============ AGENT MODELS ============
-from .agent import (
-    BroadcastResult,
-    ClaimResult,
-    ForgetResult,
-    MemoriesResult,
-    MemoryAttachSourceResult,
-    MemoryInfo,
-    MemoryInvalidateResult,
-    MemorySupersedeResult,
-    MemoryVerifyResult,
-    RecalledMemory,
-    RecallResult,
-    ReleaseResult,
-    RememberResult,
-    StateGetResult,
-    StateSetResult,
-    SwarmCreateResult,
-    SwarmJoinResult,
-    TaskClaimResult,
-    TaskCompleteResult,
-    TaskCreateResult,
-)
+import importlib
+from typing import TYPE_CHECKING
 
-# ============ CONTEXT QUERY MODELS ============
-from .context import (
-    ContextQueryResult,
-    ContextSection,
-    ContextSectionRef,
-    DecomposeResult,
-    GetChunkResult,
-    MultiQueryResult,
-    MultiQueryResultItem,
-    PlanResult,
-    PlanStep,
-    SubQuery,
-)
+# symbol -> defining submodule, used by the lazy __getattr__ below
+_LAZY_SUBMODULES: dict[str, str] = {
+    # enums
+    "AgentMemoryScope": "enums",
+    "AgentMemoryType": "enums",
+    "DecomposeStrategy": "enums",
+    "DocumentCategoryEnum": "enums",
+    "EvidenceType": "enums",
+    "IndexJobStatus": "enums",
+    "MemoryRelationType": "enums",
+    "MemorySource": "enums",
+    "MemoryStatus": "enums",
+    "Plan": "enums",
+    "PlanStrategy": "enums",
+    "SearchMode": "enums",
+    "SummaryType": "enums",
+    "ToolName": "enums",
+    # agent
+    "BroadcastResult": "agent",
+    "ClaimResult": "agent",
+    "ForgetResult": "agent",
+    "MemoriesResult": "agent",
+    "MemoryAttachSourceResult": "agent",
+    "MemoryInfo": "agent",
+    "MemoryInvalidateResult": "agent",
+    "MemorySupersedeResult": "agent",
+    "MemoryVerifyResult": "agent",
+    "RecallResult": "agent",
+    "RecalledMemory": "agent",
+    "ReleaseResult": "agent",
+    "RememberResult": "agent",
+    "StateGetResult": "agent",
+    "StateSetResult": "agent",
+    "SwarmCreateResult": "agent",
+    "SwarmJoinResult": "agent",
+    "TaskClaimResult": "agent",
+    "TaskCompleteResult": "agent",
+    "TaskCreateResult": "agent",
+    # context
+    "ContextQueryResult": "context",
+    "ContextSection": "context",
+    "ContextSectionRef": "context",
+    "DecomposeResult": "context",
+    "GetChunkResult": "context",
+    "MultiQueryResult": "context",
+    "MultiQueryResultItem": "context",
+    "PlanResult": "context",
+    "PlanStep": "context",
+    "SubQuery": "context",
+    # documents
+    "IndexJobCreateResponse": "documents",
+    "IndexJobStatusResponse": "documents",
+    "RequestAccessResult": "documents",
+    "SettingsResult": "documents",
+    "SyncDocumentsResult": "documents",
+    "UploadDocumentResult": "documents",
+    # memory_v2
+    "MemoryCreatePayload": "memory_v2",
+    "MemoryEvidencePayload": "memory_v2",
+    "MemoryMigrationMapPayload": "memory_v2",
+    "MemoryRelationPayload": "memory_v2",
+    "MemoryUpdatePayload": "memory_v2",
+    # requests
+    "AskParams": "requests",
+    "BroadcastParams": "requests",
+    "ClaimParams": "requests",
+    "ContextQueryParams": "requests",
+    "DecomposeParams": "requests",
+    "DeleteSummaryParams": "requests",
+    "ForgetParams": "requests",
+    "GetSummariesParams": "requests",
+    "GetTemplateParams": "requests",
+    "InjectParams": "requests",
+    "ListTemplatesParams": "requests",
+    "MCPRequest": "requests",
+    "MemoriesParams": "requests",
+    "MemoryAttachSourceParams": "requests",
+    "MemoryInvalidateParams": "requests",
+    "MemorySupersedeParams": "requests",
+    "MemoryVerifyParams": "requests",
+    "MultiProjectQueryParams": "requests",
+    "MultiQueryItem": "requests",
+    "MultiQueryParams": "requests",
+    "PlanParams": "requests",
+    "ReadParams": "requests",
+    "RecallParams": "requests",
+    "ReleaseParams": "requests",
+    "RememberParams": "requests",
+    "RequestAccessParams": "requests",
+    "SearchParams": "requests",
+    "SharedContextParams": "requests",
+    "StateGetParams": "requests",
+    "StateSetParams": "requests",
+    "StoreSummaryParams": "requests",
+    "SwarmCreateParams": "requests",
+    "SwarmJoinParams": "requests",
+    "SyncDocumentItem": "requests",
+    "SyncDocumentsParams": "requests",
+    "TaskClaimParams": "requests",
+    "TaskCompleteParams": "requests",
+    "TaskCreateParams": "requests",
+    # responses
+    "DocumentInfo": "responses",
+    "HealthResponse": "responses",
+    "LimitsInfo": "responses",
+    "MCPResponse": "responses",
+    "ProjectContext": "responses",
+    "ProjectSettings": "responses",
+    "ReadyResponse": "responses",
+    "SectionInfo": "responses",
+    "StatsResponse": "responses",
+    "ToolResult": "responses",
+    "UsageInfo": "responses",
+    # shared
+    "GetTemplateResult": "shared",
+    "ListTemplatesResult": "shared",
+    "PromptTemplateInfo": "shared",
+    "SharedContextResult": "shared",
+    "SharedDocumentInfo": "shared",
+    # summary
+    "DeleteSummaryResult": "summary",
+    "GetSummariesResult": "summary",
+    "StoreSummaryResult": "summary",
+    "SummaryInfo": "summary",
+}
 
-# ============ DOCUMENT MODELS ============
-from .documents import (
-    IndexJobCreateResponse,
-    IndexJobStatusResponse,
-    RequestAccessResult,
-    SettingsResult,
-    SyncDocumentsResult,
-    UploadDocumentResult,
-)
-from .enums import (
-    AgentMemoryScope,
-    AgentMemoryType,
-    DecomposeStrategy,
-    DocumentCategoryEnum,
-    EvidenceType,
-    IndexJobStatus,
-    MemoryRelationType,
-    MemorySource,
-    MemoryStatus,
-    Plan,
-    PlanStrategy,
-    SearchMode,
-    SummaryType,
-    ToolName,
-)
-from .memory_v2 import (
-    MemoryCreatePayload,
-    MemoryEvidencePayload,
-    MemoryMigrationMapPayload,
-    MemoryRelationPayload,
-    MemoryUpdatePayload,
-)
 
-# ============ REQUEST MODELS ============
-from .requests import (
-    AskParams,
-    BroadcastParams,
-    ClaimParams,
-    ContextQueryParams,
-    DecomposeParams,
-    DeleteSummaryParams,
-    ForgetParams,
-    GetSummariesParams,
-    GetTemplateParams,
-    InjectParams,
-    ListTemplatesParams,
-    MCPRequest,
-    MemoriesParams,
-    MemoryAttachSourceParams,
-    MemoryInvalidateParams,
-    MemorySupersedeParams,
-    MemoryVerifyParams,
-    MultiProjectQueryParams,
-    MultiQueryItem,
-    MultiQueryParams,
-    PlanParams,
-    ReadParams,
-    RecallParams,
-    ReleaseParams,
-    RememberParams,
-    RequestAccessParams,
-    SearchParams,
-    SharedContextParams,
-    StateGetParams,
-    StateSetParams,
-    StoreSummaryParams,
-    SwarmCreateParams,
-    SwarmJoinParams,
-    SyncDocumentItem,
-    SyncDocumentsParams,
-    TaskClaimParams,
-    TaskCompleteParams,
-    TaskCreateParams,
-)
+def __getattr__(name: str):
+    """Resolve re-exported models on first access and cache them."""
+    submodule = _LAZY_SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # cache so __getattr__ runs once per symbol
+    return value
 
-# ============ RESPONSE MODELS ============
-from .responses import (
-    DocumentInfo,
-    HealthResponse,
-    LimitsInfo,
-    MCPResponse,
-    ProjectContext,
-    ProjectSettings,
-    ReadyResponse,
-    SectionInfo,
-    StatsResponse,
-    ToolResult,
-    UsageInfo,
-)
 
-# ============ SHARED CONTEXT MODELS ============
-from .shared import (
-    GetTemplateResult,
-    ListTemplatesResult,
-    PromptTemplateInfo,
-    SharedContextResult,
-    SharedDocumentInfo,
-)
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-# ============ SUMMARY MODELS ============
-from .summary import (
-    DeleteSummaryResult,
-    GetSummariesResult,
-    StoreSummaryResult,
-    SummaryInfo,
-)
+
+if TYPE_CHECKING:
+    from .agent import (
+        BroadcastResult as BroadcastResult,
+        ClaimResult as ClaimResult,
+        ForgetResult as ForgetResult,
+        MemoriesResult as MemoriesResult,
+        MemoryAttachSourceResult as MemoryAttachSourceResult,
+        MemoryInfo as MemoryInfo,
+        MemoryInvalidateResult as MemoryInvalidateResult,
+        MemorySupersedeResult as MemorySupersedeResult,
+        MemoryVerifyResult as MemoryVerifyResult,
+        RecallResult as RecallResult,
+        RecalledMemory as RecalledMemory,
+        ReleaseResult as ReleaseResult,
+        RememberResult as RememberResult,
+        StateGetResult as StateGetResult,
+        StateSetResult as StateSetResult,
+        SwarmCreateResult as SwarmCreateResult,
+        SwarmJoinResult as SwarmJoinResult,
+        TaskClaimResult as TaskClaimResult,
+        TaskCompleteResult as TaskCompleteResult,
+        TaskCreateResult as TaskCreateResult,
+    )
+    from .context import (
+        ContextQueryResult as ContextQueryResult,
+        ContextSection as ContextSection,
+        ContextSectionRef as ContextSectionRef,
+        DecomposeResult as DecomposeResult,
+        GetChunkResult as GetChunkResult,
+        MultiQueryResult as MultiQueryResult,
+        MultiQueryResultItem as MultiQueryResultItem,
+        PlanResult as PlanResult,
+        PlanStep as PlanStep,
+        SubQuery as SubQuery,
+    )
+    from .documents import (
+        IndexJobCreateResponse as IndexJobCreateResponse,
+        IndexJobStatusResponse as IndexJobStatusResponse,
+        RequestAccessResult as RequestAccessResult,
+        SettingsResult as SettingsResult,
+        SyncDocumentsResult as SyncDocumentsResult,
+        UploadDocumentResult as UploadDocumentResult,
+    )
+    from .enums import (
+        AgentMemoryScope as AgentMemoryScope,
+        AgentMemoryType as AgentMemoryType,
+        DecomposeStrategy as DecomposeStrategy,
+        DocumentCategoryEnum as DocumentCategoryEnum,
+        EvidenceType as EvidenceType,
+        IndexJobStatus as IndexJobStatus,
+        MemoryRelationType as MemoryRelationType,
+        MemorySource as MemorySource,
+        MemoryStatus as MemoryStatus,
+        Plan as Plan,
+        PlanStrategy as PlanStrategy,
+        SearchMode as SearchMode,
+        SummaryType as SummaryType,
+        ToolName as ToolName,
+    )
+    from .memory_v2 import (
+        MemoryCreatePayload as MemoryCreatePayload,
+        MemoryEvidencePayload as MemoryEvidencePayload,
+        MemoryMigrationMapPayload as MemoryMigrationMapPayload,
+        MemoryRelationPayload as MemoryRelationPayload,
+        MemoryUpdatePayload as MemoryUpdatePayload,
+    )
+    from .requests import (
+        AskParams as AskParams,
+        BroadcastParams as BroadcastParams,
+        ClaimParams as ClaimParams,
+        ContextQueryParams as ContextQueryParams,
+        DecomposeParams as DecomposeParams,
+        DeleteSummaryParams as DeleteSummaryParams,
+        ForgetParams as ForgetParams,
+        GetSummariesParams as GetSummariesParams,
+        GetTemplateParams as GetTemplateParams,
+        InjectParams as InjectParams,
+        ListTemplatesParams as ListTemplatesParams,
+        MCPRequest as MCPRequest,
+        MemoriesParams as MemoriesParams,
+        MemoryAttachSourceParams as MemoryAttachSourceParams,
+        MemoryInvalidateParams as MemoryInvalidateParams,
+        MemorySupersedeParams as MemorySupersedeParams,
+        MemoryVerifyParams as MemoryVerifyParams,
+        MultiProjectQueryParams as MultiProjectQueryParams,
+        MultiQueryItem as MultiQueryItem,
+        MultiQueryParams as MultiQueryParams,
+        PlanParams as PlanParams,
+        ReadParams as ReadParams,
+        RecallParams as RecallParams,
+        ReleaseParams as ReleaseParams,
+        RememberParams as RememberParams,
+        RequestAccessParams as RequestAccessParams,
+        SearchParams as SearchParams,
+        SharedContextParams as SharedContextParams,
+        StateGetParams as StateGetParams,
+        StateSetParams as StateSetParams,
+        StoreSummaryParams as StoreSummaryParams,
+        SwarmCreateParams as SwarmCreateParams,
+        SwarmJoinParams as SwarmJoinParams,
+        SyncDocumentItem as SyncDocumentItem,
+        SyncDocumentsParams as SyncDocumentsParams,
+        TaskClaimParams as TaskClaimParams,
+        TaskCompleteParams as TaskCompleteParams,
+        TaskCreateParams as TaskCreateParams,
+    )
+    from .responses import (
+        DocumentInfo as DocumentInfo,
+        HealthResponse as HealthResponse,
+        LimitsInfo as LimitsInfo,
+        MCPResponse as MCPResponse,
+        ProjectContext as ProjectContext,
+        ProjectSettings as ProjectSettings,
+        ReadyResponse as ReadyResponse,
+        SectionInfo as SectionInfo,
+        StatsResponse as StatsResponse,
+        ToolResult as ToolResult,
+        UsageInfo as UsageInfo,
+    )
+    from .shared import (
+        GetTemplateResult as GetTemplateResult,
+        ListTemplatesResult as ListTemplatesResult,
+        PromptTemplateInfo as PromptTemplateInfo,
+        SharedContextResult as SharedContextResult,
+        SharedDocumentInfo as SharedDocumentInfo,
+    )
+    from .summary import (
+        DeleteSummaryResult as DeleteSummaryResult,
+        GetSummariesResult as GetSummariesResult,
+        StoreSummaryResult as StoreSummaryResult,
+        SummaryInfo as SummaryInfo,
+    )
 
 __all__ = [
     # Enums
@@ -23,6 +23,7 @@ class ToolName(StrEnum):
     RLM_PLAN = "rlm_plan"
     # Phase 4.6: Summary Storage Tools
     RLM_STORE_SUMMARY = "rlm_store_summary"
+    RLM_STORE_SUMMARY_BULK = "rlm_store_summary_bulk"
     RLM_GET_SUMMARIES = "rlm_get_summaries"
     RLM_DELETE_SUMMARY = "rlm_delete_summary"
     # Phase 7: Shared Context Tools
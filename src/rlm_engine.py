@@ -15,6 +15,8 @@ from collections import deque
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from pydantic import TypeAdapter
+
 from .config import settings
 from .db import get_db
 
@@ -43,12 +45,34 @@ from .engine.core import (
 # These are available for integration - handlers are extracted but methods
 # below still use original implementations for backward compatibility.
 # Full migration will replace _handle_* methods with calls to these functions.
-from .engine.middleware import maybe_auto_remember
+from .engine.middleware import (
+    begin_auto_remember_batch,
+    flush_auto_remember_batch,
+    maybe_auto_remember,
+)
 
 # Phase 2 Refactor: Import from extracted scoring module
 from .engine.scoring import (
     STOP_WORDS,
 )
+from .engine.scoring import (
+    calculate_keyword_score as _calculate_keyword_score,
+)
+from .engine.scoring import (
+    SemanticScorer,
+)
+from .engine.scoring import (
+    calculate_keyword_scores_batch as _calculate_keyword_scores_batch,
+)
+from .engine.scoring import (
+    classify_query_weights as _classify_query_weights_impl,
+)
+from .engine.scoring import (
+    normalize_scores_graded as _normalize_scores_graded_impl,
+)
+from .engine.scoring import (
+    rrf_fusion as _rrf_fusion_impl,
+)
 from .engine.scoring import (
     stem_keyword as _stem_keyword,
 )
@@ -189,7 +213,7 @@ PLAN_FEATURE_PLANS = {Plan.TEAM, Plan.ENTERPRISE}
 CACHE_ENABLED_PLANS = {Plan.TEAM, Plan.ENTERPRISE}
 
 # Plans that have access to summary storage features
-SUMMARY_STORAGE_PLANS = {Plan.PRO, Plan.TEAM, Plan.ENTERPRISE}
+SUMMARY_STORAGE_PLANS = frozenset({Plan.PRO, Plan.TEAM, Plan.ENTERPRISE})
 
 # Plans that have access to shared context features
 SHARED_CONTEXT_PLANS = {Plan.PRO, Plan.TEAM, Plan.ENTERPRISE}
@@ -294,6 +318,7 @@ WRITE_TOOLS = {
     ToolName.RLM_INJECT,
     ToolName.RLM_CLEAR_CONTEXT,
     ToolName.RLM_STORE_SUMMARY,
+    ToolName.RLM_STORE_SUMMARY_BULK,
     ToolName.RLM_DELETE_SUMMARY,
     ToolName.RLM_REMEMBER,
     ToolName.RLM_FORGET,
@@ -439,6 +464,9 @@ The search returned limited results. Please:
 CONCEPTUAL_QUERY_MIN_TOKENS = 5000
 # Minimum token budget for multi-hop queries (require combining info from multiple sections)
 MULTI_HOP_QUERY_MIN_TOKENS = 6000
+# Section count above which keyword scoring is offloaded to a worker thread
+# so a large index doesn't stall the event loop mid-request
+SCORING_OFFLOAD_MIN_SECTIONS = 512
 # Score threshold below which we consider results "low confidence"
 LOW_CONFIDENCE_SCORE_THRESHOLD = 15.0
 # Token budget expansion factor when confidence is low
@@ -473,6 +501,11 @@ _MULTI_HOP_PATTERNS = (
 
 logger = logging.getLogger(__name__)
 
+# Bulk validator for lists of sections: one pydantic-core call for the whole
+# list instead of one constructor call per row. Built once at import; model
+# instances in the list pass through unrevalidated.
+_SECTION_LIST_ADAPTER: TypeAdapter[list[ContextSection]] = TypeAdapter(list[ContextSection])
+
 
 class RLMEngine:
     """RLM documentation query engine."""
@@ -501,6 +534,7 @@ class RLMEngine:
         self.index: DocumentationIndex | None = None
         self.session_context: str = ""
         self._chunks_available: bool | None = None  # Cache for chunk availability check
+        self._semantic_scorer: SemanticScorer | None = None  # Lazily built, shared per engine
         self._tips_shown_this_session: bool = False  # Track if first-query tips were shown
         # Pass-by-reference chunk cache: chunk_id -> (section, file_path, score)
         # This enables rlm_get_chunk to retrieve full content by ID
@@ -848,6 +882,24 @@ class RLMEngine:
 
         return self._chunks_available
 
+    def _get_semantic_scorer(self) -> SemanticScorer:
+        """Lazily build the shared :class:`SemanticScorer` for this engine.
+
+        One instance per engine so the query embedding pre-warmed during the
+        chunk path is still around if scoring falls back to on-the-fly.
+        """
+        if self._semantic_scorer is None:
+            try:
+                embeddings_service = get_light_embeddings_service()
+            except Exception as e:
+                logger.warning(f"Light embeddings service unavailable: {e}")
+                embeddings_service = None
+            self._semantic_scorer = SemanticScorer(
+                project_id=self.project_id,
+                embeddings_service=embeddings_service,
+            )
+        return self._semantic_scorer
+
     async def _calculate_semantic_scores_from_chunks(
         self,
         query: str,
@@ -857,8 +909,9 @@ class RLMEngine:
     ) -> dict[str, float]:
         """Calculate semantic scores using pre-computed chunk embeddings via pgvector.
 
-        This is the fast path for semantic search - uses embeddings that were
-        pre-computed during document indexing rather than generating them on-the-fly.
+        Delegates to :meth:`SemanticScorer.calculate_scores_from_chunks`,
+        which vectorizes the chunk-to-section overlap mapping and pre-warms
+        the query embedding for a possible on-the-fly fallback.
 
         Args:
             query: The search query string.
@@ -870,46 +923,142 @@ class RLMEngine:
         Returns:
             Dictionary mapping section IDs to their semantic similarity scores (0-1).
         """
-        from .services.indexer import DocumentIndexer
-
         if not self.index:
             return {}
 
         db = await get_db()
-        indexer = DocumentIndexer(db)
-
-        try:
-            result = await indexer.search_similar(
-                project_id=self.project_id,
-                query=query,
-                limit=limit,
-                min_similarity=min_similarity,
-                tier_filter=tier_filter,
-            )
-
-            # Map chunk results back to section IDs by line overlap
-            scores: dict[str, float] = {}
-            for chunk in result.get("results", []):
-                chunk_start = chunk.get("start_line", 0)
-                chunk_end = chunk.get("end_line", 0)
-                chunk_similarity = chunk.get("similarity", 0.0)
-
-                for section in self.index.sections:
-                    # Check if chunk overlaps with section (by line range)
-                    if chunk_start <= section.end_line and chunk_end >= section.start_line:
-                        # Use max score if section appears in multiple chunks
-                        current_score = scores.get(section.id, 0.0)
-                        scores[section.id] = max(current_score, chunk_similarity)
-
-            logger.info(
-                f"Chunk-based semantic search: {len(result.get('results', []))} chunks, "
-                f"{len(scores)} sections scored"
-            )
-            return scores
-
-        except Exception as e:
-            logger.warning(f"Chunk-based semantic search failed: {e}")
-            return {}
+        return await self._get_semantic_scorer().calculate_scores_from_chunks(
+            query=query,
+            db=db,
+            limit=limit,
+            min_similarity=min_similarity,
+            sections=self.index.sections,
+            tier_filter=tier_filter,
+        )
+
+    # Tool -> handler-method-name dispatch table. Built once at class
+    # creation; execute() binds only the one handler it needs per call
+    # instead of rebuilding a ~100-entry dict of bound methods.
+    _TOOL_HANDLERS: dict[ToolName, str] = {
+        ToolName.RLM_ASK: "_handle_ask",
+        ToolName.RLM_SEARCH: "_handle_search",
+        ToolName.RLM_INJECT: "_handle_inject",
+        ToolName.RLM_CONTEXT: "_handle_context",
+        ToolName.RLM_CLEAR_CONTEXT: "_handle_clear_context",
+        ToolName.RLM_STATS: "_handle_stats",
+        ToolName.RLM_HELP: "_handle_help",
+        ToolName.RLM_SECTIONS: "_handle_sections",
+        ToolName.RLM_READ: "_handle_read",
+        ToolName.RLM_CONTEXT_QUERY: "_handle_context_query",
+        # Phase 4.5: Recursive Context Tools
+        ToolName.RLM_DECOMPOSE: "_handle_decompose",
+        ToolName.RLM_MULTI_QUERY: "_handle_multi_query",
+        ToolName.RLM_PLAN: "_handle_plan",
+        ToolName.RLM_MULTI_PROJECT_QUERY: "_handle_multi_project_query",
+        # Phase 4.6: Summary Storage Tools
+        ToolName.RLM_STORE_SUMMARY: "_handle_store_summary",
+        ToolName.RLM_STORE_SUMMARY_BULK: "_handle_store_summary_bulk",
+        ToolName.RLM_GET_SUMMARIES: "_handle_get_summaries",
+        ToolName.RLM_DELETE_SUMMARY: "_handle_delete_summary",
+        # Phase 7: Shared Context Tools
+        ToolName.RLM_SHARED_CONTEXT: "_handle_shared_context",
+        ToolName.RLM_LIST_TEMPLATES: "_handle_list_templates",
+        ToolName.RLM_GET_TEMPLATE: "_handle_get_template",
+        ToolName.RLM_LIST_COLLECTIONS: "_handle_list_collections",
+        ToolName.RLM_UPLOAD_SHARED_DOCUMENT: "_handle_upload_shared_document",
+        # Phase 8.2: Agent Memory Tools
+        ToolName.RLM_REMEMBER: "_handle_remember",
+        ToolName.RLM_REMEMBER_BULK: "_handle_remember_bulk",
+        ToolName.RLM_RECALL: "_handle_recall",
+        ToolName.RLM_MEMORIES: "_handle_memories",
+        ToolName.RLM_FORGET: "_handle_forget",
+        ToolName.RLM_MEMORY_INVALIDATE: "_handle_memory_invalidate",
+        ToolName.RLM_MEMORY_ATTACH_SOURCE: "_handle_memory_attach_source",
+        ToolName.RLM_MEMORY_SUPERSEDE: "_handle_memory_supersede",
+        ToolName.RLM_MEMORY_VERIFY: "_handle_memory_verify",
+        # Phase 18: Daily Journal Tools
+        ToolName.RLM_JOURNAL_APPEND: "_handle_journal_append",
+        ToolName.RLM_JOURNAL_GET: "_handle_journal_get",
+        ToolName.RLM_JOURNAL_SUMMARIZE: "_handle_journal_summarize",
+        # Phase 20: Memory Tiers & Compaction
+        ToolName.RLM_SESSION_MEMORIES: "_handle_session_memories",
+        ToolName.RLM_MEMORY_COMPACT: "_handle_memory_compact",
+        ToolName.RLM_MEMORY_DAILY_BRIEF: "_handle_memory_daily_brief",
+        # Phase 20: Tenant Profile
+        ToolName.RLM_TENANT_PROFILE_CREATE: "_handle_tenant_profile_create",
+        ToolName.RLM_TENANT_PROFILE_GET: "_handle_tenant_profile_get",
+        # Phase 9.1: Multi-Agent Swarm Tools
+        ToolName.RLM_SWARM_CREATE: "_handle_swarm_create",
+        ToolName.RLM_SWARM_JOIN: "_handle_swarm_join",
+        ToolName.RLM_CLAIM: "_handle_claim",
+        ToolName.RLM_RELEASE: "_handle_release",
+        ToolName.RLM_STATE_GET: "_handle_state_get",
+        ToolName.RLM_STATE_SET: "_handle_state_set",
+        ToolName.RLM_STATE_POLL: "_handle_state_poll",
+        ToolName.RLM_BROADCAST: "_handle_broadcast",
+        ToolName.RLM_SWARM_EVENTS: "_handle_swarm_events",
+        ToolName.RLM_TASK_CREATE: "_handle_task_create",
+        ToolName.RLM_TASK_BULK_CREATE: "_handle_task_bulk_create",
+        ToolName.RLM_TASK_CLAIM: "_handle_task_claim",
+        ToolName.RLM_TASK_COMPLETE: "_handle_task_complete",
+        ToolName.RLM_TASKS: "_handle_tasks",
+        ToolName.RLM_TASK_LIST: "_handle_task_list",
+        ToolName.RLM_TASK_STATS: "_handle_task_stats",
+        ToolName.RLM_TASK_EVENTS: "_handle_task_events",
+        ToolName.RLM_AGENT_STATUS: "_handle_agent_status",
+        ToolName.RLM_SWARM_LEAVE: "_handle_swarm_leave",
+        ToolName.RLM_SWARM_MEMBERS: "_handle_swarm_members",
+        ToolName.RLM_SWARM_UPDATE: "_handle_swarm_update",
+        ToolName.RLM_TASK_REASSIGN: "_handle_task_reassign",
+        ToolName.RLM_TASK_DELETE: "_handle_task_delete",
+        ToolName.RLM_TASK_UPDATE: "_handle_task_update",
+        ToolName.RLM_TASK_UNCLAIM: "_handle_task_unclaim",
+        ToolName.RLM_TASK_RECOVER: "_handle_task_recover",
+        # Phase 19: Agent Profiles (Soul Layer)
+        ToolName.RLM_AGENT_PROFILE_GET: "_handle_agent_profile_get",
+        ToolName.RLM_AGENT_PROFILE_UPDATE: "_handle_agent_profile_update",
+        # Phase 10: Document Sync Tools
+        ToolName.RLM_UPLOAD_DOCUMENT: "_handle_upload_document",
+        ToolName.RLM_SYNC_DOCUMENTS: "_handle_sync_documents",
+        ToolName.RLM_SETTINGS: "_handle_settings",
+        # Phase 11: Access Control Tools
+        ToolName.RLM_REQUEST_ACCESS: "_handle_request_access",
+        # Phase 12: RLM Orchestration Tools
+        ToolName.RLM_LOAD_DOCUMENT: "_handle_load_document",
+        ToolName.RLM_LOAD_PROJECT: "_handle_load_project",
+        ToolName.RLM_ORCHESTRATE: "_handle_orchestrate",
+        # Phase 13: REPL Context Bridge
+        ToolName.RLM_REPL_CONTEXT: "_handle_repl_context",
+        # Phase 14: Pass-by-Reference
+        ToolName.RLM_GET_CHUNK: "_handle_get_chunk",
+        # Phase 15: Decision Log
+        ToolName.RLM_DECISION_CREATE: "_handle_decision_create",
+        ToolName.RLM_DECISION_QUERY: "_handle_decision_query",
+        ToolName.RLM_DECISION_SUPERSEDE: "_handle_decision_supersede",
+        # Phase 16: Index Health & Search Analytics (Sprint 3)
+        ToolName.RLM_INDEX_HEALTH: "_handle_index_health",
+        ToolName.RLM_INDEX_RECOMMENDATIONS: "_handle_index_recommendations",
+        ToolName.RLM_SEARCH_ANALYTICS: "_handle_search_analytics",
+        ToolName.RLM_QUERY_TRENDS: "_handle_query_trends",
+        # Phase 17: Hierarchical Tasks
+        ToolName.RLM_HTASK_CREATE: "_handle_htask_create",
+        ToolName.RLM_HTASK_CREATE_FEATURE: "_handle_htask_create_feature",
+        ToolName.RLM_HTASK_GET: "_handle_htask_get",
+        ToolName.RLM_HTASK_TREE: "_handle_htask_tree",
+        ToolName.RLM_HTASK_UPDATE: "_handle_htask_update",
+        ToolName.RLM_HTASK_BLOCK: "_handle_htask_block",
+        ToolName.RLM_HTASK_UNBLOCK: "_handle_htask_unblock",
+        ToolName.RLM_HTASK_COMPLETE: "_handle_htask_complete",
+        ToolName.RLM_HTASK_VERIFY_CLOSURE: "_handle_htask_verify_closure",
+        ToolName.RLM_HTASK_CLOSE: "_handle_htask_close",
+        ToolName.RLM_HTASK_DELETE: "_handle_htask_delete",
+        ToolName.RLM_HTASK_RECOMMEND_BATCH: "_handle_htask_recommend_batch",
+        ToolName.RLM_HTASK_POLICY_GET: "_handle_htask_policy_get",
+        ToolName.RLM_HTASK_POLICY_UPDATE: "_handle_htask_policy_update",
+        ToolName.RLM_HTASK_METRICS: "_handle_htask_metrics",
+        ToolName.RLM_HTASK_AUDIT_TRAIL: "_handle_htask_audit_trail",
+        ToolName.RLM_HTASK_CHECKPOINT_DELTA: "_handle_htask_checkpoint_delta",
+    }
 
     async def execute(self, tool: ToolName, params: dict[str, Any]) -> ToolResult:
         """
@@ -928,129 +1077,10 @@ class RLMEngine:
             await self.load_session_context()
 
         # Route to appropriate handler
-        handlers = {
-            ToolName.RLM_ASK: self._handle_ask,
-            ToolName.RLM_SEARCH: self._handle_search,
-            ToolName.RLM_INJECT: self._handle_inject,
-            ToolName.RLM_CONTEXT: self._handle_context,
-            ToolName.RLM_CLEAR_CONTEXT: self._handle_clear_context,
-            ToolName.RLM_STATS: self._handle_stats,
-            ToolName.RLM_HELP: self._handle_help,
-            ToolName.RLM_SECTIONS: self._handle_sections,
-            ToolName.RLM_READ: self._handle_read,
-            ToolName.RLM_CONTEXT_QUERY: self._handle_context_query,
-            # Phase 4.5: Recursive Context Tools
-            ToolName.RLM_DECOMPOSE: self._handle_decompose,
-            ToolName.RLM_MULTI_QUERY: self._handle_multi_query,
-            ToolName.RLM_PLAN: self._handle_plan,
-            ToolName.RLM_MULTI_PROJECT_QUERY: self._handle_multi_project_query,
-            # Phase 4.6: Summary Storage Tools
-            ToolName.RLM_STORE_SUMMARY: self._handle_store_summary,
-            ToolName.RLM_GET_SUMMARIES: self._handle_get_summaries,
-            ToolName.RLM_DELETE_SUMMARY: self._handle_delete_summary,
-            # Phase 7: Shared Context Tools
-            ToolName.RLM_SHARED_CONTEXT: self._handle_shared_context,
-            ToolName.RLM_LIST_TEMPLATES: self._handle_list_templates,
-            ToolName.RLM_GET_TEMPLATE: self._handle_get_template,
-            ToolName.RLM_LIST_COLLECTIONS: self._handle_list_collections,
-            ToolName.RLM_UPLOAD_SHARED_DOCUMENT: self._handle_upload_shared_document,
-            # Phase 8.2: Agent Memory Tools
-            ToolName.RLM_REMEMBER: self._handle_remember,
-            ToolName.RLM_REMEMBER_BULK: self._handle_remember_bulk,
-            ToolName.RLM_RECALL: self._handle_recall,
-            ToolName.RLM_MEMORIES: self._handle_memories,
-            ToolName.RLM_FORGET: self._handle_forget,
-            ToolName.RLM_MEMORY_INVALIDATE: self._handle_memory_invalidate,
-            ToolName.RLM_MEMORY_ATTACH_SOURCE: self._handle_memory_attach_source,
-            ToolName.RLM_MEMORY_SUPERSEDE: self._handle_memory_supersede,
-            ToolName.RLM_MEMORY_VERIFY: self._handle_memory_verify,
-            # Phase 18: Daily Journal Tools
-            ToolName.RLM_JOURNAL_APPEND: self._handle_journal_append,
-            ToolName.RLM_JOURNAL_GET: self._handle_journal_get,
-            ToolName.RLM_JOURNAL_SUMMARIZE: self._handle_journal_summarize,
-            # Phase 20: Memory Tiers & Compaction
-            ToolName.RLM_SESSION_MEMORIES: self._handle_session_memories,
-            ToolName.RLM_MEMORY_COMPACT: self._handle_memory_compact,
-            ToolName.RLM_MEMORY_DAILY_BRIEF: self._handle_memory_daily_brief,
-            # Phase 20: Tenant Profile
-            ToolName.RLM_TENANT_PROFILE_CREATE: self._handle_tenant_profile_create,
-            ToolName.RLM_TENANT_PROFILE_GET: self._handle_tenant_profile_get,
-            # Phase 9.1: Multi-Agent Swarm Tools
-            ToolName.RLM_SWARM_CREATE: self._handle_swarm_create,
-            ToolName.RLM_SWARM_JOIN: self._handle_swarm_join,
-            ToolName.RLM_CLAIM: self._handle_claim,
-            ToolName.RLM_RELEASE: self._handle_release,
-            ToolName.RLM_STATE_GET: self._handle_state_get,
-            ToolName.RLM_STATE_SET: self._handle_state_set,
-            ToolName.RLM_STATE_POLL: self._handle_state_poll,
-            ToolName.RLM_BROADCAST: self._handle_broadcast,
-            ToolName.RLM_SWARM_EVENTS: self._handle_swarm_events,
-            ToolName.RLM_TASK_CREATE: self._handle_task_create,
-            ToolName.RLM_TASK_BULK_CREATE: self._handle_task_bulk_create,
-            ToolName.RLM_TASK_CLAIM: self._handle_task_claim,
-            ToolName.RLM_TASK_COMPLETE: self._handle_task_complete,
-            ToolName.RLM_TASKS: self._handle_tasks,
-            ToolName.RLM_TASK_LIST: self._handle_task_list,
-            ToolName.RLM_TASK_STATS: self._handle_task_stats,
-            ToolName.RLM_TASK_EVENTS: self._handle_task_events,
-            ToolName.RLM_AGENT_STATUS: self._handle_agent_status,
-            ToolName.RLM_SWARM_LEAVE: self._handle_swarm_leave,
-            ToolName.RLM_SWARM_MEMBERS: self._handle_swarm_members,
-            ToolName.RLM_SWARM_UPDATE: self._handle_swarm_update,
-            ToolName.RLM_TASK_REASSIGN: self._handle_task_reassign,
-            ToolName.RLM_TASK_DELETE: self._handle_task_delete,
-            ToolName.RLM_TASK_UPDATE: self._handle_task_update,
-            ToolName.RLM_TASK_UNCLAIM: self._handle_task_unclaim,
-            ToolName.RLM_TASK_RECOVER: self._handle_task_recover,
-            # Phase 19: Agent Profiles (Soul Layer)
-            ToolName.RLM_AGENT_PROFILE_GET: self._handle_agent_profile_get,
-            ToolName.RLM_AGENT_PROFILE_UPDATE: self._handle_agent_profile_update,
-            # Phase 10: Document Sync Tools
-            ToolName.RLM_UPLOAD_DOCUMENT: self._handle_upload_document,
-            ToolName.RLM_SYNC_DOCUMENTS: self._handle_sync_documents,
-            ToolName.RLM_SETTINGS: self._handle_settings,
-            # Phase 11: Access Control Tools
-            ToolName.RLM_REQUEST_ACCESS: self._handle_request_access,
-            # Phase 12: RLM Orchestration Tools
-            ToolName.RLM_LOAD_DOCUMENT: self._handle_load_document,
-            ToolName.RLM_LOAD_PROJECT: self._handle_load_project,
-            ToolName.RLM_ORCHESTRATE: self._handle_orchestrate,
-            # Phase 13: REPL Context Bridge
-            ToolName.RLM_REPL_CONTEXT: self._handle_repl_context,
-            # Phase 14: Pass-by-Reference
-            ToolName.RLM_GET_CHUNK: self._handle_get_chunk,
-            # Phase 15: Decision Log
-            ToolName.RLM_DECISION_CREATE: self._handle_decision_create,
-            ToolName.RLM_DECISION_QUERY: self._handle_decision_query,
-            ToolName.RLM_DECISION_SUPERSEDE: self._handle_decision_supersede,
-            # Phase 16: Index Health & Search Analytics (Sprint 3)
-            ToolName.RLM_INDEX_HEALTH: self._handle_index_health,
-            ToolName.RLM_INDEX_RECOMMENDATIONS: self._handle_index_recommendations,
-            ToolName.RLM_SEARCH_ANALYTICS: self._handle_search_analytics,
-            ToolName.RLM_QUERY_TRENDS: self._handle_query_trends,
-            # Phase 17: Hierarchical Tasks
-            ToolName.RLM_HTASK_CREATE: self._handle_htask_create,
-            ToolName.RLM_HTASK_CREATE_FEATURE: self._handle_htask_create_feature,
-            ToolName.RLM_HTASK_GET: self._handle_htask_get,
-            ToolName.RLM_HTASK_TREE: self._handle_htask_tree,
-            ToolName.RLM_HTASK_UPDATE: self._handle_htask_update,
-            ToolName.RLM_HTASK_BLOCK: self._handle_htask_block,
-            ToolName.RLM_HTASK_UNBLOCK: self._handle_htask_unblock,
-            ToolName.RLM_HTASK_COMPLETE: self._handle_htask_complete,
-            ToolName.RLM_HTASK_VERIFY_CLOSURE: self._handle_htask_verify_closure,
-            ToolName.RLM_HTASK_CLOSE: self._handle_htask_close,
-            ToolName.RLM_HTASK_DELETE: self._handle_htask_delete,
-            ToolName.RLM_HTASK_RECOMMEND_BATCH: self._handle_htask_recommend_batch,
-            ToolName.RLM_HTASK_POLICY_GET: self._handle_htask_policy_get,
-            ToolName.RLM_HTASK_POLICY_UPDATE: self._handle_htask_policy_update,
-            ToolName.RLM_HTASK_METRICS: self._handle_htask_metrics,
-            ToolName.RLM_HTASK_AUDIT_TRAIL: self._handle_htask_audit_trail,
-            ToolName.RLM_HTASK_CHECKPOINT_DELTA: self._handle_htask_checkpoint_delta,
-        }
-
-        handler = handlers.get(tool)
-        if not handler:
+        handler_name = self._TOOL_HANDLERS.get(tool)
+        if not handler_name:
             raise ValueError(f"Unknown tool: {tool}")
+        handler = getattr(self, handler_name)
 
         # Check tool access level permissions
         access_error = self._check_tool_access(tool)
@@ -1063,16 +1093,23 @@ class RLMEngine:
             if agents_access_result:
                 return agents_access_result
 
-        result = await handler(params)
+        # Open the per-request auto-remember batch; nested execute() calls
+        # (e.g. multi_query fan-out) buffer into the outermost batch
+        owns_batch = begin_auto_remember_batch()
+        try:
+            result = await handler(params)
 
-        # Auto-remember middleware (non-blocking, failures logged)
-        await maybe_auto_remember(
-            tool=tool.value,  # Convert ToolName enum to string
-            params=params,
-            result=result.data if hasattr(result, "data") else {},
-            project_id=self.project_id,
-            settings=self.settings,
-        )
+            # Auto-remember middleware (non-blocking, failures logged)
+            await maybe_auto_remember(
+                tool=tool.value,  # Convert ToolName enum to string
+                params=params,
+                result=result.data if hasattr(result, "data") else {},
+                project_id=self.project_id,
+                settings=self.settings,
+            )
+        finally:
+            if owns_batch:
+                await flush_auto_remember_batch(self.project_id)
 
         return result
 
@@ -1747,7 +1784,7 @@ class RLMEngine:
             max_tokens = MULTI_HOP_QUERY_MIN_TOKENS
 
         # Conceptual queries need more context than default
-        is_conceptual_query = any(query_lower.startswith(p) for p in _CONCEPTUAL_PREFIXES)
+        is_conceptual_query = query_lower.startswith(_CONCEPTUAL_PREFIXES)
         if is_conceptual_query and max_tokens < CONCEPTUAL_QUERY_MIN_TOKENS:
             logger.info(
                 f"Conceptual query detected, boosting token budget: "
@@ -1882,8 +1919,10 @@ class RLMEngine:
                                 )
                                 continue
 
+                        # Values are trusted (computed above, right types), so
+                        # skip Pydantic validation with model_construct.
                         shared_context_sections.append(
-                            ContextSection(
+                            ContextSection.model_construct(
                                 title=f"[{cat_enum.value}] {doc.title}",
                                 content=doc.content,
                                 file=f"shared:{doc.collection_name}",
@@ -1945,7 +1984,7 @@ Rationale: {decision.rationale}"""
                     section_tokens = count_tokens(decision_content)
                     if decision_tokens + section_tokens <= remaining_budget * 0.1:  # Max 10% for decisions
                         decision_sections.append(
-                            ContextSection(
+                            ContextSection.model_construct(
                                 title=f"[DECISION:{decision.impact}] {decision.title}",
                                 content=decision_content,
                                 file="decisions",
@@ -2145,9 +2184,11 @@ Rationale: {decision.rationale}"""
             section_tokens = count_tokens(content_to_use)
 
             if total_tokens + section_tokens <= remaining_budget:
-                # Section fits - add it fully
+                # Section fits - add it fully. model_construct skips
+                # validation: every field here is computed locally from
+                # already-validated sections.
                 selected_sections.append(
-                    ContextSection(
+                    ContextSection.model_construct(
                         title=section.title,
                         content=content_to_use,
                         file=file_path,
@@ -2168,7 +2209,7 @@ Rationale: {decision.rationale}"""
 
                 if truncated_tokens >= 50:  # Only include if meaningful
                     selected_sections.append(
-                        ContextSection(
+                        ContextSection.model_construct(
                             title=section.title,
                             content=truncated_content,
                             file=file_path,
@@ -2253,8 +2294,10 @@ Rationale: {decision.rationale}"""
                     semantic_score=0.0,
                 )
 
+                # Fields come straight off a validated ContextSection, so
+                # skip re-validation.
                 section_refs.append(
-                    ContextSectionRef(
+                    ContextSectionRef.model_construct(
                         chunk_id=chunk_id,
                         title=section.title,
                         preview=preview,
@@ -2461,10 +2504,18 @@ Rationale: {decision.rationale}"""
         if is_list_query:
             logger.info(f"List query detected: '{query[:60]}...' - boosting numbered sections")
 
-        # Calculate keyword scores for all sections (always in-memory, fast)
+        # Calculate keyword scores for all sections (always in-memory, fast).
+        # Batch scoring prepares the per-query keyword invariants once
+        # instead of once per section. Large indexes run in a worker thread
+        # so concurrent requests aren't blocked while the loop scans content.
         keyword_scores: dict[str, float] = {}
-        for section in sections_to_score:
-            base_score = self._calculate_keyword_score(section, keywords)
+        if len(sections_to_score) >= SCORING_OFFLOAD_MIN_SECTIONS:
+            base_scores = await asyncio.to_thread(
+                _calculate_keyword_scores_batch, sections_to_score, keywords
+            )
+        else:
+            base_scores = _calculate_keyword_scores_batch(sections_to_score, keywords)
+        for section, base_score in zip(sections_to_score, base_scores):
 
             # Boost numbered sections for list queries (Fix #1: Query-intent detection)
             # E.g., "Article #3" should rank higher than "Example Article Structure"
@@ -2698,131 +2749,44 @@ Rationale: {decision.rationale}"""
         query: str,
         candidate_ids: set[str] | None = None,
         max_sections: int = 30,
+        top_k: int | None = None,
     ) -> dict[str, float]:
         """
         Calculate semantic similarity scores for sections (on-the-fly fallback path).
 
-        Uses the *light* embedding model (bge-small-en-v1.5, 384 dims) which is ~10x
-        faster than bge-large on CPU. This path is only used when pre-computed pgvector
-        chunks are not available. Both query and section embeddings are computed fresh
-        so dimension mismatch with pgvector (1024 dims) is not an issue.
+        Delegates to :meth:`SemanticScorer.calculate_scores_on_the_fly`, which
+        uses the *light* embedding model (bge-small-en-v1.5, 384 dims), caches
+        section embeddings across queries, and reuses the query embedding
+        pre-warmed during the chunk path when one is available.
 
         Args:
             query: The search query string.
             candidate_ids: If provided, only embed these section IDs (e.g. top keyword hits).
             max_sections: Hard cap on sections to embed (default 30). bge-small-en-v1.5
                 takes ~0.3s per text on Railway CPU; 30 sections ≈ 3-5s.
+            top_k: If set, return only the top_k highest-scoring sections.
         """
         if not self.index or not self.index.sections:
             return {}
 
-        try:
-            embeddings_service = get_light_embeddings_service()
-
-            # Filter to candidate sections if provided, otherwise use all
-            if candidate_ids is not None:
-                sections = [s for s in self.index.sections if s.id in candidate_ids]
-            else:
-                sections = list(self.index.sections)
-
-            # Hard cap to prevent batch embedding timeout on large projects
-            if len(sections) > max_sections:
-                logger.info(
-                    f"Capping on-the-fly embedding from {len(sections)} to {max_sections} sections"
-                )
-                sections = sections[:max_sections]
-
-            # Generate query embedding (async to avoid blocking event loop)
-            query_embedding = await embeddings_service.embed_text_async(query)
-
-            # Generate section embeddings (title + truncated content)
-            # Using 120 chars to reduce tokenization cost on CPU.
-            # Title carries the primary semantic signal; content adds context.
-            section_texts = [f"{s.title}\n{s.content[:120]}" for s in sections]
-            section_embeddings = await embeddings_service.embed_texts_async(section_texts)
-
-            # Calculate similarities
-            similarities = embeddings_service.cosine_similarity(query_embedding, section_embeddings)
-
-            # Map to section IDs
-            return {section.id: similarity for section, similarity in zip(sections, similarities)}
-        except Exception as e:
-            logger.warning(f"Semantic search failed, falling back to empty scores: {e}")
-            return {}
+        return await self._get_semantic_scorer().calculate_scores_on_the_fly(
+            query=query,
+            sections=self.index.sections,
+            candidate_ids=candidate_ids,
+            max_sections=max_sections,
+            top_k=top_k,
+        )
 
     def _calculate_keyword_score(self, section: Section, keywords: list[str]) -> float:
         """
         Calculate keyword relevance score for a section.
 
-        Scoring factors:
-        - Title matches weighted 5x (not length-normalized)
-        - Content matches weighted 1x (BM25-style length normalization)
-        - Section level bonus (higher level = more important)
-        - Title keyword coverage boost (multi-keyword title match)
+        Delegates to the extracted scoring module (list boosts are applied
+        separately at the call site). See
+        :func:`src.engine.scoring.calculate_keyword_score` for the scoring
+        factors.
         """
-        score = 0.0
-        title_lower = section.title.lower()
-        content_lower = section.content.lower()
-
-        # BM25-style length normalization for content scoring.
-        # Prevents long sections from dominating via raw keyword counts.
-        # avgdl ~2000 chars is a reasonable average section length.
-        content_length = len(content_lower)
-        length_norm = 1.0 / (1.0 + 0.75 * (content_length / 2000.0 - 1.0))
-        length_norm = max(length_norm, 0.15)  # Floor to avoid near-zero
-
-        title_keyword_hits = 0
-
-        for keyword in keywords:
-            if len(keyword) < 2:  # Skip very short words
-                continue
-
-            stem = _stem_keyword(keyword)
-
-            # Title matches — reduced weight for generic terms
-            title_count = title_lower.count(keyword)
-            # Fall back to stem match for morphological variants
-            # e.g. "prices" (stem "pric") matches title containing "pricing"
-            if title_count == 0 and stem != keyword:
-                title_count = title_lower.count(stem)
-            if title_count > 0:
-                title_keyword_hits += 1
-                # Generic terms get 1.5x weight, specific terms get 5x
-                # This prevents "Snipara tools not available" ranking above
-                # actual tool documentation for "What tools does Snipara expose?"
-                if keyword in _GENERIC_TITLE_TERMS or stem in _GENERIC_TITLE_TERMS:
-                    score += title_count * 1.5
-                else:
-                    score += title_count * 5.0
-
-            # Content matches (length-normalized)
-            content_count = content_lower.count(keyword)
-            if content_count == 0 and stem != keyword:
-                content_count = content_lower.count(stem)
-            score += content_count * length_norm
-
-        # Bonus for higher-level sections (h1, h2 more important)
-        level_bonus = max(0, 4 - section.level) * 0.5
-        score += level_bonus if score > 0 else 0
-
-        # Title keyword coverage boost: when multiple query keywords appear
-        # in the section title, this section is likely a direct topical match.
-        # Apply multiplicative boost proportional to the number of title hits.
-        if title_keyword_hits >= 2:
-            coverage_boost = 1.0 + title_keyword_hits * 2.0
-            score *= coverage_boost
-
-        # Exact phrase match bonus: if the entire query (or a significant portion)
-        # appears verbatim in the title, this is very likely the right section.
-        # This dramatically improves NDCG for specific queries.
-        query_words = [w for w in keywords if len(w) >= 3]
-        if len(query_words) >= 2:
-            query_phrase = " ".join(query_words[:4])  # First 4 significant words
-            if query_phrase.lower() in title_lower:
-                score *= 3.0  # 3x bonus for exact phrase in title
-                logger.debug(f"Exact phrase match in title: '{query_phrase}' → '{section.title}'")
-
-        return score
+        return _calculate_keyword_score(section, keywords)
 
     # ------------------------------------------------------------------
     # Adaptive Hybrid Search helpers
@@ -2845,35 +2809,10 @@ Rationale: {decision.rationale}"""
            and doesn't contain structured-data terms ➜ semantic-heavy (30/70).
 
         3. **Default** – balanced (50/50).
+
+        Delegates to :func:`src.engine.scoring.classify_query_weights`.
         """
-        query_lower = query.lower()
-        query_words = {w for w in re.findall(r"\w+", query_lower) if len(w) > 2}
-
-        # Signal 1: strong keyword confidence
-        kw_values = [v for v in keyword_scores.values() if v > 0]
-        strong_keyword = False
-        if kw_values:
-            top_kw = max(kw_values)
-            # Top score is at least 3× the median – very confident match
-            median_kw = sorted(kw_values)[len(kw_values) // 2] if kw_values else 0
-            strong_keyword = top_kw > 15 and (median_kw == 0 or top_kw / median_kw >= 3)
-
-        # Signal 2: specific / structured-data terms in the query
-        # Also check stemmed variants so "prices" matches "price" in the set
-        stemmed_words = {_stem_keyword(w) for w in query_words}
-        has_specific = bool((query_words | stemmed_words) & _SPECIFIC_QUERY_TERMS)
-
-        # Signal 3: conceptual query pattern
-        is_conceptual = any(query_lower.startswith(p) for p in _CONCEPTUAL_PREFIXES)
-
-        # Priority: specific keyword matches first, then conceptual patterns
-        if strong_keyword and has_specific:
-            return _HYBRID_KEYWORD_HEAVY
-        if strong_keyword:
-            return _HYBRID_BALANCED  # Don't go full keyword-heavy without specific terms
-        if is_conceptual:
-            return _HYBRID_SEMANTIC_HEAVY
-        return _HYBRID_BALANCED
+        return _classify_query_weights_impl(query, keyword_scores)
 
     @staticmethod
     def _rrf_fusion(
@@ -2885,48 +2824,16 @@ Rationale: {decision.rationale}"""
     ) -> list[tuple[str, float]]:
         """Reciprocal Rank Fusion of keyword and semantic rankings.
 
-        RRF score for document *d*::
-
-            rrf(d) = w_kw / (k + rank_kw(d)) + w_sem / (k + rank_sem(d))
-
-        Unlike weighted-score averaging, RRF is **rank-based** so it is
-        robust to score-magnitude mismatches between keyword and semantic
-        signals (the root cause of the hybrid regression on ``tech_stack``
-        and ``core_value_prop``).
-
-        Sections absent from a ranking receive a pessimistic rank equal to
-        ``len(ranking) + 1``.
+        Delegates to the vectorized implementation in the extracted scoring
+        module; see :func:`src.engine.scoring.rrf_fusion`.
         """
-        # Build keyword ranking (descending score)
-        kw_ranked = sorted(
-            ((sid, sc) for sid, sc in keyword_scores.items() if sc > 0),
-            key=lambda x: x[1],
-            reverse=True,
+        return _rrf_fusion_impl(
+            keyword_scores=keyword_scores,
+            semantic_scores=semantic_scores,
+            keyword_weight=keyword_weight,
+            semantic_weight=semantic_weight,
+            k=k,
         )
-        kw_rank: dict[str, int] = {sid: rank for rank, (sid, _) in enumerate(kw_ranked, start=1)}
-        default_kw_rank = len(kw_ranked) + 1
-
-        # Build semantic ranking (descending similarity)
-        sem_ranked = sorted(
-            ((sid, sc) for sid, sc in semantic_scores.items() if sc > 0),
-            key=lambda x: x[1],
-            reverse=True,
-        )
-        sem_rank: dict[str, int] = {sid: rank for rank, (sid, _) in enumerate(sem_ranked, start=1)}
-        default_sem_rank = len(sem_ranked) + 1
-
-        # Union of all section IDs present in either ranking
-        all_ids = set(kw_rank) | set(sem_rank)
-
-        rrf_scores: list[tuple[str, float]] = []
-        for sid in all_ids:
-            rk = kw_rank.get(sid, default_kw_rank)
-            rs = sem_rank.get(sid, default_sem_rank)
-            score = keyword_weight / (k + rk) + semantic_weight / (k + rs)
-            rrf_scores.append((sid, score))
-
-        rrf_scores.sort(key=lambda x: x[1], reverse=True)
-        return rrf_scores
 
     def _normalize_scores_graded(
         self, scores: list[tuple[str, float]], decay_factor: float = 0.94
@@ -2948,29 +2855,10 @@ Rationale: {decision.rationale}"""
 
         Returns:
             List of (id, graded_score) with clear separation
-        """
-        if not scores:
-            return []
-
-        # Top score gets 100
-        top_score = scores[0][1] if scores[0][1] > 0 else 1.0
-        result = [(scores[0][0], 100.0)]
 
-        for i, (sid, raw) in enumerate(scores[1:], start=1):
-            # Combine rank-based decay with score-ratio decay
-            # rank_factor: exponential decay based on position (0.94^rank)
-            # score_factor: how close is this score to the top? (raw/top)
-            rank_factor = decay_factor**i
-            score_factor = raw / top_score if top_score > 0 else 0
-
-            # Weighted combination: 40% rank-based, 60% score-based (favor raw scores for better recall)
-            # Higher score_weight keeps more relevant sections that may have lower ranks
-            graded = 100 * (0.4 * rank_factor + 0.6 * score_factor)
-
-            # Floor at 1 (never 0 unless truly irrelevant)
-            result.append((sid, max(round(graded, 1), 1.0)))
-
-        return result
+        Delegates to :func:`src.engine.scoring.normalize_scores_graded`.
+        """
+        return _normalize_scores_graded_impl(scores, decay_factor)
 
     def _find_file_for_section(self, section: Section) -> str:
         """Find which file a section belongs to based on line numbers.
@@ -3295,12 +3183,12 @@ Rationale: {decision.rationale}"""
                 }
                 result = await self._handle_context_query(query_params)
 
-                # Extract sections from result
+                # Extract sections from result (bulk-validates dicts from
+                # cached payloads, passes live instances through untouched)
                 result_data = result.data
-                sections = [
-                    ContextSection(**s) if isinstance(s, dict) else s
-                    for s in result_data.get("sections", [])
-                ]
+                sections = _SECTION_LIST_ADAPTER.validate_python(
+                    result_data.get("sections", [])
+                )
 
                 return MultiQueryResultItem(
                     query=query_item["query"],
@@ -3749,15 +3637,11 @@ Rationale: {decision.rationale}"""
         Returns:
             ToolResult with StoreSummaryResult containing summary ID
         """
-        document_path = params.get("document_path", "")
+        from .engine.handlers.summary import handle_store_summary
+
         summary = params.get("summary", "")
-        summary_type_str = params.get("summary_type", "concise")
-        section_id = params.get("section_id")
-        line_start = params.get("line_start")
-        line_end = params.get("line_end")
-        generated_by = params.get("generated_by")
 
-        # Plan gating
+        # Plan gating before touching the DB (handler context needs a connection)
         if self.plan not in SUMMARY_STORAGE_PLANS:
             return ToolResult(
                 data={
@@ -3769,7 +3653,7 @@ Rationale: {decision.rationale}"""
             )
 
         # Validate inputs
-        if not document_path:
+        if not params.get("document_path"):
             return ToolResult(
                 data={"error": "document_path is required"},
                 input_tokens=0,
@@ -3783,87 +3667,45 @@ Rationale: {decision.rationale}"""
                 output_tokens=0,
             )
 
-        # Parse summary type
-        try:
-            summary_type = SummaryType(summary_type_str)
-        except ValueError:
-            summary_type = SummaryType.CONCISE
+        return await handle_store_summary(params, await self._get_handler_ctx())
 
-        db = await get_db()
-
-        # Find the document
-        document = await db.document.find_first(
-            where={
-                "projectId": self.project_id,
-                "path": document_path,
-            }
-        )
+    async def _handle_store_summary_bulk(self, params: dict[str, Any]) -> ToolResult:
+        """
+        Handle rlm_store_summary_bulk - store many summaries in one batch.
 
-        if not document:
-            return ToolResult(
-                data={"error": f"Document not found: {document_path}"},
-                input_tokens=count_tokens(summary),
-                output_tokens=0,
-            )
+        Resolves all target documents with one query and inserts the batch
+        with a single create_many instead of one round-trip per summary.
 
-        # Calculate token count for the summary
-        token_count = count_tokens(summary)
+        Args:
+            params: Dict containing:
+                - summaries: List of dicts, each with document_path and summary
+                  plus optional summary_type, section_id, line_start, line_end,
+                  generated_by
 
-        # Check if summary already exists (upsert)
-        existing = await db.documentsummary.find_first(
-            where={
-                "documentId": document.id,
-                "summaryType": summary_type.value,
-                "sectionId": section_id,
-            }
-        )
+        Returns:
+            ToolResult with stored/skipped/failed counts and per-index failures
+        """
+        from .engine.handlers.summary import handle_store_summary_bulk
 
-        if existing:
-            # Update existing summary
-            await db.documentsummary.update(
-                where={"id": existing.id},
+        # Plan gating before touching the DB (handler context needs a connection)
+        if self.plan not in SUMMARY_STORAGE_PLANS:
+            return ToolResult(
                 data={
-                    "summary": summary,
-                    "tokenCount": token_count,
-                    "lineStart": line_start,
-                    "lineEnd": line_end,
-                    "generatedBy": generated_by,
+                    "error": "rlm_store_summary_bulk requires Pro plan or higher",
+                    "upgrade_url": "/billing/upgrade",
                 },
+                input_tokens=0,
+                output_tokens=0,
             )
-            created = False
-            summary_id = existing.id
-        else:
-            # Create new summary
-            created_summary = await db.documentsummary.create(
-                data={
-                    "documentId": document.id,
-                    "projectId": self.project_id,
-                    "summary": summary,
-                    "summaryType": summary_type.value,
-                    "sectionId": section_id,
-                    "lineStart": line_start,
-                    "lineEnd": line_end,
-                    "tokenCount": token_count,
-                    "generatedBy": generated_by,
-                }
-            )
-            created = True
-            summary_id = created_summary.id
 
-        result = StoreSummaryResult(
-            summary_id=summary_id,
-            document_path=document_path,
-            summary_type=summary_type,
-            token_count=token_count,
-            created=created,
-            message=f"Summary {'created' if created else 'updated'} successfully ({token_count} tokens)",
-        )
+        if not params.get("summaries"):
+            return ToolResult(
+                data={"error": "summaries is required"},
+                input_tokens=0,
+                output_tokens=0,
+            )
 
-        return ToolResult(
-            data=result.model_dump(),
-            input_tokens=count_tokens(summary),
-            output_tokens=count_tokens(str(result.model_dump())),
-        )
+        return await handle_store_summary_bulk(params, await self._get_handler_ctx())
 
     async def _handle_get_summaries(self, params: dict[str, Any]) -> ToolResult:
         """
@@ -3875,16 +3717,14 @@ Rationale: {decision.rationale}"""
                 - summary_type: Filter by summary type (optional)
                 - section_id: Filter by section ID (optional)
                 - include_content: Include summary content in response (default True)
+                - count_only: Return only totals via SQL aggregation (default False)
 
         Returns:
             ToolResult with GetSummariesResult containing matching summaries
         """
-        document_path = params.get("document_path")
-        summary_type_str = params.get("summary_type")
-        section_id = params.get("section_id")
-        include_content = params.get("include_content", True)
+        from .engine.handlers.summary import handle_get_summaries
 
-        # Plan gating
+        # Plan gating before touching the DB (handler context needs a connection)
         if self.plan not in SUMMARY_STORAGE_PLANS:
             return ToolResult(
                 data={
@@ -3895,89 +3735,7 @@ Rationale: {decision.rationale}"""
                 output_tokens=0,
             )
 
-        db = await get_db()
-
-        # Build query filters
-        where_clause: dict[str, Any] = {"projectId": self.project_id}
-
-        if document_path:
-            # Find document ID first
-            document = await db.document.find_first(
-                where={
-                    "projectId": self.project_id,
-                    "path": document_path,
-                }
-            )
-            if document:
-                where_clause["documentId"] = document.id
-            else:
-                # No document found, return empty
-                return ToolResult(
-                    data=GetSummariesResult(
-                        summaries=[],
-                        total_count=0,
-                        total_tokens=0,
-                    ).model_dump(),
-                    input_tokens=0,
-                    output_tokens=0,
-                )
-
-        if summary_type_str:
-            try:
-                summary_type = SummaryType(summary_type_str)
-                where_clause["summaryType"] = summary_type.value
-            except ValueError:
-                pass
-
-        if section_id:
-            where_clause["sectionId"] = section_id
-
-        # Query summaries with document info
-        summaries = await db.documentsummary.find_many(
-            where=where_clause,
-            include={"document": True},
-            order={"createdAt": "desc"},
-        )
-
-        # Build response
-        summary_infos: list[SummaryInfo] = []
-        total_tokens = 0
-
-        for s in summaries:
-            try:
-                summary_type_enum = SummaryType(s.summaryType)
-            except ValueError:
-                summary_type_enum = SummaryType.CUSTOM
-
-            summary_info = SummaryInfo(
-                summary_id=s.id,
-                document_path=s.document.path if s.document else "unknown",
-                summary_type=summary_type_enum,
-                section_id=s.sectionId,
-                line_start=s.lineStart,
-                line_end=s.lineEnd,
-                token_count=s.tokenCount,
-                generated_by=s.generatedBy,
-                content=s.summary if include_content else None,
-                created_at=s.createdAt,
-                updated_at=s.updatedAt,
-            )
-            summary_infos.append(summary_info)
-            total_tokens += s.tokenCount
-
-        result = GetSummariesResult(
-            summaries=summary_infos,
-            total_count=len(summary_infos),
-            total_tokens=total_tokens,
-        )
-
-        output_tokens = total_tokens if include_content else len(summary_infos) * 50
-
-        return ToolResult(
-            data=result.model_dump(),
-            input_tokens=0,
-            output_tokens=output_tokens,
-        )
+        return await handle_get_summaries(params, await self._get_handler_ctx())
 
     async def _handle_delete_summary(self, params: dict[str, Any]) -> ToolResult:
         """
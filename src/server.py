@@ -55,6 +55,7 @@ from .usage import (
     get_demo_analytics,
     get_usage_stats,
     log_security_event,
+    scan_identifier,
     track_demo_query,
     track_usage,
 )
@@ -485,7 +486,7 @@ async def team_mcp_transport_endpoint(
             "auth.failed",
             "team",
             team_id,
-            api_key[:12],
+            scan_identifier(api_key),
             team_id=team.id,
             details={"reason": "invalid_team_api_key"},
         )
@@ -9,6 +9,7 @@ import asyncio
 import json
 import logging
 import re
+import uuid
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -374,6 +375,95 @@ async def store_memory(
     }
 
 
+async def store_memory_many(
+    project_id: str,
+    memories: list[dict[str, Any]],
+) -> int:
+    """Batch-insert pre-built memories with a single ``create_many``.
+
+    Unlike :func:`store_memories_bulk`, which creates rows one at a time, this
+    path does one INSERT for the whole batch. It backs the auto-remember
+    middleware, which flushes all memories accumulated during a request at
+    once. Rows get client-generated IDs because ``create_many`` does not
+    return them, and the follow-up work needs them: embeddings are batch
+    generated and stored just like :func:`store_memories_bulk`, and when
+    Memory V2 dual-write is enabled the new rows are mirrored the same way.
+
+    Args:
+        project_id: The project ID
+        memories: Memory dicts with content, and optional type, scope,
+            category, ttl_days, and source keys
+
+    Returns:
+        Number of memories created
+    """
+    if not memories:
+        return 0
+
+    db = await get_db()
+    now = datetime.now(UTC)
+
+    rows: list[dict[str, Any]] = []
+    for mem in memories:
+        ttl_days = mem.get("ttl_days")
+        expires_at = now + timedelta(days=ttl_days) if ttl_days else None
+        rows.append(
+            {
+                "id": str(uuid.uuid4()),
+                "projectId": project_id,
+                "content": mem["content"],
+                "type": mem.get("type", "fact").upper(),
+                "scope": mem.get("scope", "project").upper(),
+                "category": mem.get("category"),
+                "expiresAt": expires_at,
+                "relatedMemoryIds": [],
+                "documentRefs": [],
+                "source": mem.get("source"),
+                "confidence": 1.0,
+                "accessCount": 0,
+            }
+        )
+
+    created = await db.agentmemory.create_many(data=rows)
+
+    # Batch generate embeddings for the new rows (same pattern as
+    # store_memories_bulk) so they are recallable semantically right away.
+    try:
+        embeddings_service = get_embeddings_service()
+        embeddings = await embeddings_service.embed_texts_async([r["content"] for r in rows])
+
+        tasks = []
+        for row, mem, emb in zip(rows, memories, embeddings):
+            ttl_days = mem.get("ttl_days")
+            embedding_ttl = MEMORY_EMBEDDING_TTL
+            if ttl_days:
+                embedding_ttl = min(ttl_days * 24 * 60 * 60, MEMORY_EMBEDDING_TTL)
+            tasks.append(_store_memory_embedding(row["id"], emb, embedding_ttl))
+        await asyncio.gather(*tasks, return_exceptions=True)
+    except Exception as e:
+        logger.warning(f"Failed to generate batch embeddings: {e}")
+        # Memories still created, just without embeddings
+
+    # Mirror into Memory V2 when dual-write is on. create_many returns only a
+    # count, so fetch the inserted rows back by the IDs we generated.
+    if settings.memory_v2_dual_write:
+        try:
+            created_memories = await db.agentmemory.find_many(
+                where={"id": {"in": [r["id"] for r in rows]}}
+            )
+            await asyncio.gather(
+                *(_dual_write_legacy_memory_object(memory) for memory in created_memories),
+                return_exceptions=True,
+            )
+        except Exception as e:
+            logger.warning(f"Batch Memory V2 dual-write failed: {e}")
+
+    # Trigger auto-compaction check (non-blocking)
+    asyncio.create_task(_safe_auto_compact(project_id))
+
+    return created
+
+
 async def _dual_write_legacy_memory_object(legacy_memory: Any) -> str | None:
     """Persist a legacy AgentMemory ORM row into Memory V2."""
 
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
@@ -37,6 +38,9 @@ EMBEDDING_TIMEOUT_BATCH = 60.0  # Timeout for batch embedding (larger texts)
 # Thread pool for embedding operations
 _embedding_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="embedding")
 
+# Max cached query embeddings per model instance (~1.5KB each at 384 dims)
+_EMBED_CACHE_SIZE = 512
+
 
 class EmbeddingsService:
     """Service for generating text embeddings using sentence-transformers.
@@ -54,6 +58,12 @@ class EmbeddingsService:
         """Initialize the embeddings service for a specific model."""
         self._model_name = model_name
         self._model: SentenceTransformer | None = None
+        # LRU of recent single-text embeddings: the same query repeats
+        # across retries, hybrid passes and decompose fan-out, and each
+        # encoder pass is ~0.3s on CPU. Keyed by text only — the cache is
+        # per instance, so the model (and its dimension) is implied.
+        self._embed_cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._embed_cache_lock = asyncio.Lock()
 
     @classmethod
     def get_instance(cls, model_name: str = MODEL_NAME) -> EmbeddingsService:
@@ -102,6 +112,24 @@ class EmbeddingsService:
             # Import here to avoid loading torch at startup
             from sentence_transformers import SentenceTransformer
 
+            from ..config import settings
+
+            # Optional ONNX Runtime backend — quantized CPU inference is
+            # 2-3x faster than FP32 torch on the Railway CPU-only hosts.
+            # Best-effort: requires sentence-transformers >= 3.2 with the
+            # onnx extras; fall back to the torch path if anything is off.
+            if settings.embedding_backend == "onnx":
+                try:
+                    self._model = SentenceTransformer(
+                        self._model_name, device="cpu", backend="onnx"
+                    )
+                    logger.info(
+                        f"Embedding model loaded: {self._model_name} (device: cpu, backend: onnx)"
+                    )
+                    return self._model
+                except Exception as e:
+                    logger.warning(f"ONNX embedding backend unavailable, using torch: {e}")
+
             # Explicitly load on CPU to avoid meta tensor issues on memory-constrained environments
             self._model = SentenceTransformer(self._model_name, device="cpu")
             logger.info(f"Embedding model loaded: {self._model_name} (device: cpu)")
@@ -157,17 +185,29 @@ class EmbeddingsService:
         Raises:
             asyncio.TimeoutError: If embedding takes longer than timeout.
         """
+        async with self._embed_cache_lock:
+            cached = self._embed_cache.get(text)
+            if cached is not None:
+                self._embed_cache.move_to_end(text)
+                return list(cached)
+
         loop = asyncio.get_event_loop()
         try:
             result = await asyncio.wait_for(
                 loop.run_in_executor(_embedding_executor, self.embed_text, text),
                 timeout=timeout,
             )
-            return result
         except TimeoutError:
             logger.warning(f"Embedding timed out after {timeout}s for text of length {len(text)}")
             raise
 
+        async with self._embed_cache_lock:
+            self._embed_cache[text] = list(result)
+            self._embed_cache.move_to_end(text)
+            while len(self._embed_cache) > _EMBED_CACHE_SIZE:
+                self._embed_cache.popitem(last=False)
+        return result
+
     async def embed_texts_async(
         self, texts: list[str], batch_size: int = 32, timeout: float = EMBEDDING_TIMEOUT_BATCH
     ) -> list[list[float]]:
@@ -220,7 +260,7 @@ class EmbeddingsService:
             return []
 
         try:
-            query = np.array(query_embedding)
+            query = np.asarray(query_embedding, dtype=np.float32)
             expected_dim = len(query_embedding)
 
             # Filter out embeddings with mismatched dimensions
@@ -241,7 +281,7 @@ class EmbeddingsService:
             if not valid_embeddings:
                 return [0.0] * len(doc_embeddings)
 
-            docs = np.array(valid_embeddings)
+            docs = np.asarray(valid_embeddings, dtype=np.float32)
 
             # Validate dimensions
             if docs.ndim != 2:
@@ -250,12 +290,16 @@ class EmbeddingsService:
                     "This indicates inconsistent embedding dimensions."
                 )
 
-            # Normalize vectors
-            query_norm = query / (np.linalg.norm(query) + 1e-10)
-            docs_norm = docs / (np.linalg.norm(docs, axis=1, keepdims=True) + 1e-10)
-
-            # Cosine similarity
-            valid_similarities = np.dot(docs_norm, query_norm).tolist()
+            # Cosine similarity as one matvec with the norms folded into the
+            # division — avoids materializing a normalized copy of the whole
+            # [N, D] matrix just to dot it against the query. Squared norms
+            # via vdot/einsum skip np.linalg.norm's Python-level dispatch
+            # and collapse the per-vector sqrts into a single vectorized one.
+            dots = docs @ query
+            q_norm_sq = float(np.vdot(query, query))
+            doc_norms_sq = np.einsum("ij,ij->i", docs, docs)
+            denom = np.sqrt(doc_norms_sq * q_norm_sq) + 1e-10
+            valid_similarities = (dots / denom).tolist()
 
             # Reconstruct full result list with 0.0 for invalid embeddings
             if invalid_indices:
@@ -43,11 +43,30 @@ class Chunk:
 class DocumentIndexer:
     """Service for indexing documents with embeddings for semantic search."""
 
+    # Whether the server's pgvector supports hnsw.iterative_scan (>= 0.8).
+    # Probed once per process; None = not yet probed.
+    _iterative_scan_supported: bool | None = None
+
     def __init__(self, db: Prisma):
         """Initialize the indexer with a database connection."""
         self.db = db
         self.embeddings = get_embeddings_service()
 
+    async def _supports_iterative_scan(self) -> bool:
+        """Probe (once per process) whether hnsw.iterative_scan is available.
+
+        The GUC exists from pgvector 0.8; SET LOCAL on an older server would
+        abort the surrounding transaction, so we check outside it first.
+        """
+        if DocumentIndexer._iterative_scan_supported is None:
+            try:
+                await self.db.query_raw("SHOW hnsw.iterative_scan")
+                DocumentIndexer._iterative_scan_supported = True
+            except Exception:
+                DocumentIndexer._iterative_scan_supported = False
+                logger.info("pgvector hnsw.iterative_scan not available (requires >= 0.8)")
+        return DocumentIndexer._iterative_scan_supported
+
     async def index_document(self, document_id: str) -> int:
         """
         Index a single document by chunking and embedding.
@@ -97,7 +116,7 @@ class DocumentIndexer:
                 INSERT INTO document_chunks
                 (id, content, embedding, "startLine", "endLine", "tokenCount", title, "createdAt", "documentId",
                  "qualityScore", "isComplete", "isTruncated")
-                VALUES (gen_random_uuid()::text, $1, $2::vector, $3, $4, $5, $6, NOW(), $7, $8, $9, $10)
+                VALUES (gen_random_uuid()::text, $1, $2::halfvec, $3, $4, $5, $6, NOW(), $7, $8, $9, $10)
                 """,
                 chunk.content,
                 embedding_str,
@@ -225,33 +244,50 @@ class DocumentIndexer:
             tiers_str = ", ".join(f"'{t}'" for t in tier_filter)
             tier_clause = f"AND dc.tier IN ({tiers_str})"
 
-        # Time vector search query
+        # HNSW candidate-list size for this query: larger ef_search = better
+        # recall, more hops. Scale with the requested limit, floored at 100
+        # (pgvector's default 40 under-recalls once the index grows).
+        ef_search = max(limit * 2, 100)
+
+        # Low-selectivity filters (small projects, tier filters) are HNSW's
+        # weak spot: the scan can exhaust its candidate list before finding
+        # `limit` rows that pass the WHERE clause. pgvector 0.8's iterative
+        # scan resumes the graph walk until enough filtered rows are found,
+        # which recovers recall without maintaining per-project indexes.
+        iterative_scan = await self._supports_iterative_scan()
+
+        # Time vector search query. SET LOCAL scopes the HNSW parameters to
+        # this transaction so pooled connections aren't left reconfigured.
         search_start = time.perf_counter()
-        results = await self.db.query_raw(
-            f"""
-            SELECT
-                dc.id,
-                dc.content,
-                dc."startLine",
-                dc."endLine",
-                dc."tokenCount",
-                dc.title,
-                dc.tier,
-                d.path as file_path,
-                1 - (dc.embedding <=> $1::vector) as similarity
-            FROM document_chunks dc
-            JOIN documents d ON dc."documentId" = d.id
-            WHERE d."projectId" = $2
-              AND 1 - (dc.embedding <=> $1::vector) >= $3
-              {tier_clause}
-            ORDER BY dc.embedding <=> $1::vector
-            LIMIT $4
-            """,
-            embedding_str,
-            project_id,
-            min_similarity,
-            limit,
-        )
+        async with self.db.tx() as tx:
+            await tx.execute_raw(f"SET LOCAL hnsw.ef_search = {ef_search}")
+            if iterative_scan:
+                await tx.execute_raw("SET LOCAL hnsw.iterative_scan = relaxed_order")
+            results = await tx.query_raw(
+                f"""
+                SELECT
+                    dc.id,
+                    dc.content,
+                    dc."startLine",
+                    dc."endLine",
+                    dc."tokenCount",
+                    dc.title,
+                    dc.tier,
+                    d.path as file_path,
+                    1 - (dc.embedding <=> $1::halfvec) as similarity
+                FROM document_chunks dc
+                JOIN documents d ON dc."documentId" = d.id
+                WHERE d."projectId" = $2
+                  AND 1 - (dc.embedding <=> $1::halfvec) >= $3
+                  {tier_clause}
+                ORDER BY dc.embedding <=> $1::halfvec
+                LIMIT $4
+                """,
+                embedding_str,
+                project_id,
+                min_similarity,
+                limit,
+            )
         search_ms = int((time.perf_counter() - search_start) * 1000)
 
         # Track chunk access for tier promotion (fire and forget)
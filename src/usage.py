@@ -1,6 +1,7 @@
 """Usage tracking and rate limiting module."""
 
 import asyncio
+import hashlib
 import logging
 import time
 from collections import defaultdict
@@ -23,6 +24,13 @@ _local_rate_limits: dict[str, list[float]] = defaultdict(list)
 _local_ip_rate_limits: dict[str, list[float]] = defaultdict(list)
 _fallback_warning_logged: bool = False
 
+# IPs Redis has already throttled, remembered locally until their window
+# expires. A throttle storm otherwise pays one Redis round-trip per blocked
+# request — exactly when load is highest. Bounded; expired entries are
+# pruned opportunistically.
+_ip_blocked_until: dict[str, float] = {}
+_IP_BLOCK_CACHE_MAX = 50_000
+
 
 async def get_redis() -> redis.Redis | None:
     """Get or create Redis client. Returns None if Redis is not configured."""
@@ -249,6 +257,13 @@ async def check_ip_rate_limit(client_ip: str) -> bool:
     if not client_ip:
         return True  # Skip if IP not available
 
+    # Locally-cached block: Redis already said no for this window
+    blocked_until = _ip_blocked_until.get(client_ip)
+    if blocked_until is not None:
+        if time.time() < blocked_until:
+            return False
+        del _ip_blocked_until[client_ip]
+
     r = await get_redis()
 
     if r is None:
@@ -273,6 +288,16 @@ async def check_ip_rate_limit(client_ip: str) -> bool:
         count = int(count)
         if count >= settings.ip_rate_limit_requests:
             logger.warning(f"IP rate limit exceeded for {client_ip}")
+            # Remember the block for the key's remaining lifetime so repeat
+            # requests from this IP are refused without another round-trip
+            ttl = await r.ttl(key)
+            if ttl > 0:
+                if len(_ip_blocked_until) >= _IP_BLOCK_CACHE_MAX:
+                    now = time.time()
+                    for ip in [i for i, t in _ip_blocked_until.items() if t <= now]:
+                        del _ip_blocked_until[ip]
+                if len(_ip_blocked_until) < _IP_BLOCK_CACHE_MAX:
+                    _ip_blocked_until[client_ip] = time.time() + ttl
             return False
 
         await r.incr(key)
@@ -595,8 +620,20 @@ SCAN_THRESHOLD = 10  # unique denied slugs
 SCAN_BLOCK_SECONDS = 900  # 15 minute block
 
 # In-memory tracking (per-process fallback)
-_scan_denials: dict[str, dict[str, float]] = defaultdict(dict)  # key_prefix -> {slug: timestamp}
-_scan_blocks: dict[str, float] = {}  # key_prefix -> block_until timestamp
+_scan_denials: dict[str, dict[str, float]] = defaultdict(dict)  # identifier -> {slug: timestamp}
+_scan_blocks: dict[str, float] = {}  # identifier -> block_until timestamp
+
+
+def scan_identifier(api_key: str) -> str:
+    """Fixed-width scan-tracking identifier for an API key.
+
+    Hashes the first 12 characters of the key so Redis keys and security
+    logs carry a uniform 16-char token instead of raw credential material.
+    Only the prefix is hashed: keys sharing a prefix must map to the same
+    counter, or counting unique denied slugs per prefix stops detecting
+    scans.
+    """
+    return hashlib.blake2b(api_key[:12].encode(), digest_size=8).hexdigest()
 
 
 async def record_access_denial(identifier: str, project_slug: str) -> None:
@@ -604,7 +641,7 @@ async def record_access_denial(identifier: str, project_slug: str) -> None:
     Record a denied project access attempt for scan detection.
 
     Args:
-        identifier: Key prefix (first 12 chars of API key)
+        identifier: Opaque key identifier (see scan_identifier)
         project_slug: The project slug/ID that was denied
     """
     now = time.time()
@@ -646,10 +683,10 @@ async def record_access_denial(identifier: str, project_slug: str) -> None:
 
 async def is_scan_blocked(identifier: str) -> bool:
     """
-    Check if a key prefix is blocked due to scan detection.
+    Check if a key is blocked due to scan detection.
 
     Args:
-        identifier: Key prefix (first 12 chars of API key)
+        identifier: Opaque key identifier (see scan_identifier)
 
     Returns:
         True if blocked, False otherwise
@@ -9,7 +9,9 @@ import tests.conftest_handlers  # noqa: F401
 from src.engine.middleware.auto_remember import (
     AUTO_REMEMBER_TOOLS,
     EXCLUDED_TOOLS,
+    begin_auto_remember_batch,
     extract_memory_content,
+    flush_auto_remember_batch,
     maybe_auto_remember,
 )
 
@@ -302,6 +304,70 @@ class TestMaybeAutoRemember:
             # If we get here without exception, test passes
 
 
+class TestAutoRememberBatch:
+    """Tests for per-request batching of auto-memories."""
+
+    @pytest.mark.asyncio
+    async def test_batch_buffers_and_flushes_once(self):
+        """Memories buffered during a batch are flushed with one bulk insert."""
+        settings = MockSettings(memory_save_on_commit=True)
+
+        with (
+            patch(
+                "src.engine.middleware.auto_remember.store_memory", new_callable=AsyncMock
+            ) as mock_store,
+            patch(
+                "src.engine.middleware.auto_remember.store_memory_many",
+                new_callable=AsyncMock,
+            ) as mock_store_many,
+        ):
+            assert begin_auto_remember_batch() is True
+
+            for query in ["auth flow", "rate limiting"]:
+                await maybe_auto_remember(
+                    tool="rlm_context_query",
+                    params={"query": query},
+                    result={"sections": [{"title": "Some Long Section Title"}]},
+                    project_id="proj_123",
+                    settings=settings,
+                )
+
+            # Nothing written while the batch is open
+            mock_store.assert_not_called()
+            mock_store_many.assert_not_called()
+
+            await flush_auto_remember_batch("proj_123")
+
+            mock_store.assert_not_called()
+            mock_store_many.assert_called_once()
+            _, memories = mock_store_many.call_args.args
+            assert len(memories) == 2
+            assert all(m["source"] == "auto" for m in memories)
+
+    @pytest.mark.asyncio
+    async def test_nested_begin_does_not_own_batch(self):
+        """A second begin while a batch is open returns False (no double flush)."""
+        assert begin_auto_remember_batch() is True
+        try:
+            assert begin_auto_remember_batch() is False
+        finally:
+            with patch(
+                "src.engine.middleware.auto_remember.store_memory_many",
+                new_callable=AsyncMock,
+            ):
+                await flush_auto_remember_batch("proj_123")
+
+    @pytest.mark.asyncio
+    async def test_flush_without_batch_is_noop(self):
+        """Flushing with no open batch does not hit the database."""
+        with patch(
+            "src.engine.middleware.auto_remember.store_memory_many",
+            new_callable=AsyncMock,
+        ) as mock_store_many:
+            await flush_auto_remember_batch("proj_123")
+            mock_store_many.assert_not_called()
+
+
 class TestToolConfiguration:
     """Tests for tool configuration constants."""
 
@@ -12,6 +12,7 @@ from src.engine.core import (
     DocumentationIndex,
     Section,
     count_tokens,
+    estimate_tokens,
     expand_query,
     get_encoder,
     has_planned_content_markers,
@@ -132,6 +133,22 @@ class TestTokenCounting:
         # Should be roughly 10-15 tokens for this text
         assert 5 < tokens < 20
 
+    def test_estimate_tokens_empty(self):
+        """Test empty string estimates to 0."""
+        assert estimate_tokens("") == 0
+
+    def test_estimate_tokens_reasonable(self):
+        """Test byte-length estimate is in the right ballpark."""
+        text = "This is a test sentence with about forty characters."
+        tokens = estimate_tokens(text)
+        # ~3.8 bytes per token → roughly 14 tokens for this text
+        assert 5 < tokens < 25
+
+    def test_count_tokens_large_text_uses_estimate(self):
+        """Test very large texts are estimated, not exact-encoded."""
+        text = "word " * 5000  # 25k chars, over LARGE_TEXT_THRESHOLD
+        assert count_tokens(text) == estimate_tokens(text)
+
     def test_get_encoder(self):
         """Test encoder is returned."""
         encoder = get_encoder()
@@ -183,6 +183,15 @@ class TestToolDefinitions:
         assert "chunk_id" in tool["inputSchema"]["properties"]
         assert "chunk_id" in tool["inputSchema"]["required"]
 
+    def test_store_summary_bulk_tool_exists(self):
+        """Test rlm_store_summary_bulk tool is defined."""
+        tool = next((t for t in TOOL_DEFINITIONS if t["name"] == "rlm_store_summary_bulk"), None)
+        assert tool is not None
+        assert "summaries" in tool["inputSchema"]["properties"]
+        assert "summaries" in tool["inputSchema"]["required"]
+        item_schema = tool["inputSchema"]["properties"]["summaries"]["items"]
+        assert item_schema["required"] == ["document_path", "summary"]
+
     def test_tool_count(self):
         """Test expected number of tools."""
         # There should be 43 tools based on MCP_TOOLS_COMPLETE.md
@@ -430,6 +430,147 @@ class TestStoreSummaryPlanGating:
         assert "summary" in result.data["error"]
 
 
+@pytest.mark.skipif(not PRISMA_AVAILABLE, reason="Prisma client not generated")
+class TestStoreSummaryBulkPlanGating:
+    """Test plan gating for rlm_store_summary_bulk."""
+
+    @pytest.fixture
+    def free_engine(self):
+        """Create RLMEngine with FREE plan."""
+        return RLMEngine("test-project", plan=Plan.FREE)
+
+    @pytest.fixture
+    def pro_engine(self):
+        """Create RLMEngine with PRO plan."""
+        return RLMEngine("test-project", plan=Plan.PRO)
+
+    @pytest.mark.asyncio
+    async def test_free_plan_rejected(self, free_engine):
+        """Test FREE plan cannot store summaries in bulk."""
+        result = await free_engine._handle_store_summary_bulk({
+            "summaries": [{"document_path": "docs/test.md", "summary": "Test summary"}],
+        })
+        assert "error" in result.data
+        assert "Pro plan" in result.data["error"]
+
+    @pytest.mark.asyncio
+    async def test_missing_summaries(self, pro_engine):
+        """Test missing summaries returns error."""
+        result = await pro_engine._handle_store_summary_bulk({})
+        assert "error" in result.data
+        assert "summaries" in result.data["error"]
+
+
+@pytest.mark.skipif(not PRISMA_AVAILABLE, reason="Prisma client not generated")
+class TestStoreSummaryBulkDedupe:
+    """Re-running a bulk store must not duplicate whole-document summaries.
+
+    sectionId is nullable and Postgres unique indexes treat NULLs as
+    distinct, so the handler dedupes app-side; these tests exercise that
+    path with a fake db.
+    """
+
+    def _make_db(self, stored_rows):
+        """Fake Prisma client that records create_many rows in stored_rows."""
+        from types import SimpleNamespace
+
+        doc = SimpleNamespace(id="doc-1", path="docs/test.md")
+
+        async def find_documents(where):
+            return [doc]
+
+        async def find_summaries(where):
+            return [
+                SimpleNamespace(
+                    documentId=r["documentId"],
+                    summaryType=r["summaryType"],
+                    sectionId=r["sectionId"],
+                )
+                for r in stored_rows
+            ]
+
+        async def create_many(data, skip_duplicates=False):
+            stored_rows.extend(data)
+            return len(data)
+
+        return SimpleNamespace(
+            document=SimpleNamespace(find_many=find_documents),
+            documentsummary=SimpleNamespace(
+                find_many=find_summaries, create_many=create_many
+            ),
+        )
+
+    def _make_ctx(self):
+        from src.engine.handlers.base import HandlerContext
+
+        return HandlerContext(
+            project_id="test-project",
+            user_id=None,
+            team_id=None,
+            plan=Plan.PRO,
+            access_level="EDITOR",
+            settings=None,
+            session_context="",
+            tips_shown=False,
+            index=None,
+            db=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_rerun_without_section_id_skips_existing(self, monkeypatch):
+        """Second bulk call with section_id omitted inserts no duplicate row."""
+        from src.engine.handlers import summary as summary_module
+
+        stored_rows = []
+        db = self._make_db(stored_rows)
+
+        async def fake_get_db():
+            return db
+
+        monkeypatch.setattr(summary_module, "get_db", fake_get_db)
+
+        params = {
+            "summaries": [
+                {"document_path": "docs/test.md", "summary": "A whole-document summary."}
+            ]
+        }
+        ctx = self._make_ctx()
+
+        first = await summary_module.handle_store_summary_bulk(params, ctx)
+        assert first.data["stored"] == 1
+        assert first.data["skipped"] == 0
+
+        second = await summary_module.handle_store_summary_bulk(params, ctx)
+        assert second.data["stored"] == 0
+        assert second.data["skipped"] == 1
+        assert len(stored_rows) == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicate_within_batch_inserted_once(self, monkeypatch):
+        """Repeats of the same (document, type, NULL section) in one batch collapse."""
+        from src.engine.handlers import summary as summary_module
+
+        stored_rows = []
+        db = self._make_db(stored_rows)
+
+        async def fake_get_db():
+            return db
+
+        monkeypatch.setattr(summary_module, "get_db", fake_get_db)
+
+        params = {
+            "summaries": [
+                {"document_path": "docs/test.md", "summary": "First copy."},
+                {"document_path": "docs/test.md", "summary": "Second copy."},
+            ]
+        }
+
+        result = await summary_module.handle_store_summary_bulk(params, self._make_ctx())
+        assert result.data["stored"] == 1
+        assert result.data["skipped"] == 1
+        assert len(stored_rows) == 1
+
+
 @pytest.mark.skipif(not PRISMA_AVAILABLE, reason="Prisma client not generated")
 class TestGetSummariesPlanGating:
     """Test plan gating for rlm_get_summaries."""